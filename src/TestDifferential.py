@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.differential import check_task_set, random_task_set, reference_schedule, run, shrink
+from src.simulatorTool.rate_monotonic import RateMonotonic
+
+
+class _LongestPeriodFirst(RateMonotonic):
+    """Broken RM: the longest period gets the highest priority."""
+
+    def select_next_job_from_active(self, active_jobs):
+        return max(active_jobs, key=lambda job: job.T) if active_jobs else None
+
+
+class TestDifferential(unittest.TestCase):
+
+    def test_random_task_sets_agree(self):
+        for case in range(150):
+            task_set = random_task_set(np.random.default_rng([7, case]))
+            self.assertEqual(check_task_set(task_set), [], task_set.to_string())
+
+    def test_parallel_run(self):
+        self.assertEqual(run(40, seed=3, max_workers=2), [])
+
+    def test_reference_schedule(self):
+        task_set = pd.DataFrame({'task_id': ['A', 'B'], 'C_i': [1, 3], 'T_i': [4, 5], 'D_i': [4, 5]})
+        self.assertEqual(reference_schedule(task_set, "RM")["B"], [(0, 4), (5, 8), (10, 14), (15, 19)])
+
+    def test_detects_broken_scheduler(self):
+        task_set = pd.DataFrame({'task_id': [1, 2], 'C_i_min': [1, 3], 'C_i': [1, 3], 'T_i': [4, 5], 'D_i': [4, 5]})
+        messages = check_task_set(task_set, rm=_LongestPeriodFirst())
+        self.assertTrue(any(message.startswith("RM task 1") for message in messages), messages)
+
+    def test_shrink_to_minimal_failing_task_set(self):
+        task_set = random_task_set(np.random.default_rng(1), max_tasks=6)
+        task_set = pd.concat([task_set, task_set.assign(C_i=5, C_i_min=5, T_i=20, D_i=20)], ignore_index=True)
+
+        shrunk = shrink(task_set, lambda candidate: bool((candidate["C_i"] >= 4).any()))
+
+        self.assertEqual(len(shrunk), 1)
+        self.assertEqual(shrunk["C_i"].tolist(), [4])
+        self.assertEqual(shrunk["T_i"].tolist(), [4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,19 @@
+import unittest
+from src.import_benchmark import measure
+
+
+class TestImports(unittest.TestCase):
+    """Short CLI runs and worker processes must not pay for pandas/numpy/matplotlib at import."""
+
+    def test_core_engine_is_stdlib_only(self):
+        for module in ["src.simulatorTool.simulator", "src.simulatorTool.rate_monotonic",
+                       "src.simulatorTool.earliest_deadline_first"]:
+            self.assertEqual(measure(module, repeat=1)[1], [], module)
+
+    def test_entry_points_load_heavy_dependencies_lazily(self):
+        for module in ["src.main", "src.pipeline", "src.misc.parser", "src.misc.result_cache"]:
+            self.assertEqual(measure(module, repeat=1)[1], [], module)
+
+
+if __name__ == "__main__":
+    unittest.main()
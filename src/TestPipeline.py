@@ -0,0 +1,74 @@
+import os
+import tempfile
+import time
+import unittest
+from src.pipeline import SimulationPipeline
+from src.simulatorTool.earliest_deadline_first import EDF
+from src.simulatorTool.rate_monotonic import RateMonotonic
+
+
+class TestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+
+    def write_csv(self, name, rows):
+        path = os.path.join(self.work_dir, name)
+        with open(path, "w") as f:
+            f.write("Task,BCET,WCET,Period,Deadline\n")
+            for task, wcet, period in rows:
+                f.write(f"{task},1,{wcet},{period},{period}\n")
+        return path
+
+    def test_results_in_order_with_their_own_verdict(self):
+        # U = 1: EDF schedules it, RM does not (R_B = 7 > 6)
+        paths = [self.write_csv(f"set_{i}.csv", [("A", 2, 4), ("B", 3, 6)]) for i in range(3)]
+        results = []
+        pipeline = SimulationPipeline([RateMonotonic(), EDF()], True, 1, max_workers=1)
+
+        self.assertEqual(pipeline.run_paths(paths, results.append), 6)
+
+        self.assertEqual([(r.metrics.task_set_name, r.metrics.algorithm) for r in results],
+                         [(f"set_{i}.csv", algorithm) for i in range(3) for algorithm in ("RateMonotonic", "EDF")])
+        self.assertEqual({(r.metrics.algorithm, r.analysis, r.analysis_schedulable, r.metrics.is_scheduable_simulator)
+                          for r in results},
+                         {("RateMonotonic", "RTA", False, False), ("EDF", "Processor demand", True, True)})
+
+    def test_slow_report_holds_back_loading(self):
+        paths = [self.write_csv(f"set_{i}.csv", [("A", 1, 4)]) for i in range(30)]
+        consumed = []
+        ahead = []
+
+        def lazy_paths():
+            for path in paths:
+                consumed.append(path)
+                yield path
+
+        def report(result):
+            ahead.append(len(consumed) - len(ahead))
+            time.sleep(0.02)
+
+        pipeline = SimulationPipeline([RateMonotonic()], True, 1, max_workers=1, queue_size=1)
+        self.assertEqual(pipeline.run_paths(lazy_paths(), report), 30)
+        # loader, 3 queues of one item, screening, one simulation and the report in progress
+        self.assertLessEqual(max(ahead), 7)
+
+    def test_errors_propagate(self):
+        good = self.write_csv("good.csv", [("A", 1, 4)])
+        bad = os.path.join(self.work_dir, "bad.csv")
+        with open(bad, "w") as f:
+            f.write("Task,BCET,WCET\nA,1,1\n")
+        pipeline = SimulationPipeline([RateMonotonic()], True, 1, max_workers=1)
+
+        with self.assertRaises(ValueError):
+            pipeline.run_paths([good, bad], lambda result: None)
+
+        def report(result):
+            raise RuntimeError("report failed")
+
+        with self.assertRaisesRegex(RuntimeError, "report failed"):
+            pipeline.run_paths([good], report)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from src.misc.result_cache import ResultCache
+from src.server import AnalysisService, make_server
+
+
+class TestServer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cache = ResultCache(os.path.join(tempfile.mkdtemp(), "results.sqlite"))
+        cls.service = AnalysisService("test_examples/schedulable", cache, max_workers=2)
+        cls.server = make_server(cls.service, port=0)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.service.close()
+
+    def request(self, method, path, body=None):
+        data = json.dumps(body).encode() if body is not None else None
+        req = urllib.request.Request(self.url + path, data=data, method=method)
+        try:
+            with urllib.request.urlopen(req) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as error:
+            return error.code, json.loads(error.read())
+
+    def test_rta_and_simulation_agree(self):
+        tasks = {"tasks": [
+            {"task_id": "A", "WCET": 1, "Period": 4, "Deadline": 4},
+            {"task_id": "B", "WCET": 3, "Period": 5, "Deadline": 5},
+        ]}
+
+        status, rta = self.request("POST", "/rta", tasks)
+        self.assertEqual(status, 200)
+        self.assertTrue(rta["schedulable"])
+
+        status, sim = self.request("POST", "/simulate", dict(tasks, algorithm="RM", wcet=True))
+        self.assertEqual(status, 200)
+        simulated = {task["task_id"]: task["wcrt"] for task in sim["tasks"]}
+        analytic = {task["task_id"]: task["R_i"] for task in rta["tasks"]}
+        self.assertEqual(simulated, analytic)
+
+    def test_corpus_and_metrics(self):
+        status, corpus = self.request("GET", "/corpus")
+        self.assertEqual(status, 200)
+        name = corpus["task_sets"][0]
+
+        status, edf = self.request("POST", "/edf", {"task_set": name})
+        self.assertEqual(status, 200)
+        self.assertTrue(edf["schedulable"])
+
+        status, error = self.request("POST", "/edf", {"task_set": "missing.csv"})
+        self.assertEqual(status, 400)
+
+        status, metrics = self.request("GET", "/metrics")
+        self.assertEqual(metrics["endpoints"]["/edf"]["requests"], 2)
+        self.assertEqual(metrics["endpoints"]["/edf"]["errors"], 1)
+
+    def test_simulation_cache_counters(self):
+        body = {"tasks": [{"WCET": 1, "Period": 4, "Deadline": 4}, {"WCET": 2, "Period": 6, "Deadline": 6}], "seed": 11}
+        _, before = self.request("GET", "/metrics")
+        responses = [self.request("POST", "/simulate", body) for _ in range(3)]
+        _, after = self.request("GET", "/metrics")
+
+        self.assertEqual(responses[0], responses[2])
+        self.assertEqual(after["result_cache"]["misses"] - before["result_cache"]["misses"], 1)
+        self.assertEqual(after["result_cache"]["hits"] - before["result_cache"]["hits"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.sharding import parse_shard, select_shard, merge_results, ShardResultWriter, WorkQueue
+
+
+class TestSharding(unittest.TestCase):
+
+    def setUp(self):
+        self.csv_paths = [f"/corpus/dir{i % 3}/task_set_{i}.csv" for i in range(40)]
+
+    def test_parse_shard(self):
+        self.assertEqual(parse_shard("2/4"), (2, 4))
+        for value in ["4/4", "-1/4", "1/0", "1", "a/b"]:
+            with self.assertRaises(ValueError):
+                parse_shard(value)
+
+    def test_shards_partition_the_corpus(self):
+        shards = [select_shard(self.csv_paths, i, 4) for i in range(4)]
+        self.assertEqual(sorted(p for shard in shards for p in shard), sorted(self.csv_paths))
+        self.assertTrue(all(shards))
+        # same split regardless of discovery order
+        self.assertEqual(select_shard(reversed(self.csv_paths), 1, 4), shards[1])
+
+    def test_work_queue_claims_each_item_once(self):
+        work_dir = tempfile.mkdtemp()
+        first, second = WorkQueue(work_dir), WorkQueue(work_dir)
+        claimed_first = []
+        claimed_second = []
+        # interleave two workers pulling from the same directory
+        for a, b in zip(first.claim_all(self.csv_paths), second.claim_all(self.csv_paths)):
+            claimed_first.append(a)
+            claimed_second.append(b)
+        claimed_first.extend(first.claim_all(self.csv_paths))
+        self.assertEqual(sorted(claimed_first + claimed_second), sorted(self.csv_paths))
+
+    def test_stale_claims_are_taken_over_unless_done(self):
+        work_dir = tempfile.mkdtemp()
+        self.assertTrue(WorkQueue(work_dir).claim("a.csv"))
+        self.assertTrue(WorkQueue(work_dir).claim("b.csv"))
+        WorkQueue(work_dir).complete("b.csv")
+        for name in ["a.csv", "b.csv"]:
+            os.utime(os.path.join(work_dir, f"{name}.lock"), (0, 0))
+
+        retry = WorkQueue(work_dir, stale_after=60)
+        self.assertTrue(retry.claim("a.csv"))
+        self.assertFalse(retry.claim("b.csv"))
+
+    def test_stale_claim_is_taken_over_by_one_worker(self):
+        work_dir = tempfile.mkdtemp()
+        lock_path = os.path.join(work_dir, "a.csv.lock")
+        self.assertTrue(WorkQueue(work_dir).claim("a.csv"))
+        os.utime(lock_path, (0, 0))
+        stale_lock = WorkQueue._read(lock_path)
+
+        first, second = WorkQueue(work_dir, stale_after=60), WorkQueue(work_dir, stale_after=60)
+        self.assertTrue(first.claim("a.csv"))
+        fresh_lock = WorkQueue._read(lock_path)
+        self.assertNotEqual(fresh_lock, stale_lock)
+        self.assertFalse(second.claim("a.csv"))
+
+        # the second worker read the stale lock too, but acts on it only after the first took over
+        with mock.patch.object(second, "_read", side_effect=[stale_lock, fresh_lock]):
+            self.assertFalse(second.claim("a.csv"))
+        self.assertEqual(WorkQueue._read(lock_path), fresh_lock)
+
+    def test_merge_keeps_one_result_per_task_set_and_algorithm(self):
+        results_dir = tempfile.mkdtemp()
+        summary = {"task_set": "b.csv", "algorithm": "EDF", "util": 0.5, "num_late_tasks": 0,
+                   "is_schedulable_theoretical": True, "analysis": "Processor demand", "analysis_schedulable": True, "is_scheduable_simulator": True}
+        for name, rows in [("shard-0-of-2.jsonl", [summary, {**summary, "task_set": "a.csv"}]),
+                           ("shard-1-of-2.jsonl", [summary])]:
+            writer = ShardResultWriter(os.path.join(results_dir, name))
+            for row in rows:
+                writer.write(row)
+            writer.close()
+
+        merged = merge_results(results_dir)
+        self.assertEqual([(s["task_set"], s["algorithm"]) for s in merged], [("a.csv", "EDF"), ("b.csv", "EDF")])
+        self.assertEqual(merged[1], json.loads(json.dumps(summary)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import json
+import os
+import tempfile
+import unittest
+from src.pipeline import SimulationPipeline
+from src.simulatorTool.simulator import Simulator
+from src.simulatorTool.rate_monotonic import RateMonotonic
+from src.simulatorTool.task_set import TaskSet
+from src.telemetry import ProgressSampler, TelemetryMonitor, memory_usage
+
+
+class TestTelemetry(unittest.TestCase):
+
+    def setUp(self):
+        self.task_set = TaskSet.from_arrays(C=[1, 2, 3], T=[4, 6, 12], name="small.csv")
+
+    def test_samples_do_not_change_the_run(self):
+        samples = []
+        sampler = ProgressSampler(samples.append, interval=0, every=5)
+        expected = Simulator().start(self.task_set, RateMonotonic(), False, 20, 3, steady_state=False)
+        result = Simulator().start(self.task_set, RateMonotonic(), False, 20, 3, steady_state=False, telemetry=sampler)
+
+        self.assertEqual(result.job_response_times_by_task, expected.job_response_times_by_task)
+        self.assertGreater(len(samples), 2)
+        self.assertEqual([s.final for s in samples], [False] * (len(samples) - 1) + [True])
+        progress = [s.progress for s in samples]
+        self.assertEqual(progress, sorted(progress))
+        self.assertEqual(samples[-1].progress, 1.0)
+        self.assertEqual(samples[-1].horizon, 240)
+        self.assertEqual(samples[-1].completed_jobs, sum(len(jobs) for jobs in result.job_response_times_by_task.values()))
+        self.assertEqual((samples[-1].task_set, samples[-1].algorithm), ("small.csv", str(RateMonotonic())))
+
+    def test_checkpoint_excludes_the_sampler(self):
+        checkpoint_path = os.path.join(tempfile.mkdtemp(), "run.ckpt")
+        # a lambda cannot be pickled, so this fails if the sampler ends up in the checkpoint
+        sampler = ProgressSampler(lambda sample: None, interval=0, every=1)
+        Simulator().start(self.task_set, RateMonotonic(), False, 4, checkpoint_path=checkpoint_path, checkpoint_every=1,
+                          telemetry=sampler)
+        self.assertTrue(os.path.exists(checkpoint_path))
+
+    def test_memory_usage(self):
+        rss, peak_rss, traced, _ = memory_usage()
+        if os.path.exists("/proc/self/statm"):
+            self.assertGreater(rss, 0)
+            self.assertGreaterEqual(peak_rss, rss)
+
+    def test_pipeline_writes_json_lines(self):
+        work_dir = tempfile.mkdtemp()
+        csv_path = os.path.join(work_dir, "small.csv")
+        with open(csv_path, "w") as f:
+            f.write("Task,BCET,WCET,Period,Deadline\nA,1,1,4,4\nB,1,2,6,6\n")
+        telemetry_path = os.path.join(work_dir, "telemetry.jsonl")
+
+        with TelemetryMonitor(None, telemetry_path, sample_interval=0) as telemetry:
+            pipeline = SimulationPipeline([RateMonotonic()], True, 3, max_workers=1, telemetry=telemetry)
+            self.assertEqual(pipeline.run_paths([csv_path], lambda result: None), 1)
+
+        with open(telemetry_path) as f:
+            samples = [json.loads(line) for line in f]
+        self.assertTrue(samples)
+        self.assertTrue(samples[-1]["final"])
+        self.assertEqual(samples[-1]["task_set"], "small.csv")
+        self.assertEqual(samples[-1]["progress"], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import numpy as np
+from src.misc.parser import Parser
+from src.simulatorTool.task_set import TaskSet, as_task_set
+from src.analysisTool.amc_analysis_MC import (amc_max_analysis, amc_response_times, amc_rtb_analysis,
+                                              _python_hi_mode, _switch_cases, _vectorized_hi_mode)
+
+
+class TestAMCAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        # priority order A, B, C; AMC-rtb: R_C_HI = 21 > 20, AMC-max: worst switch at s = 12 gives R_C_HI = 20
+        self.df = Parser().load_records([
+            {'Task': 'A', 'BCET': 1, 'WCET_LO': 1, 'Period': 4, 'Deadline': 4, 'Criticality': 'LO'},
+            {'Task': 'B', 'BCET': 1, 'WCET_LO': 2, 'WCET_HI': 3, 'Period': 5, 'Deadline': 5, 'Criticality': 'HI'},
+            {'Task': 'C', 'BCET': 1, 'WCET_LO': 4, 'WCET_HI': 5, 'Period': 20, 'Deadline': 20, 'Criticality': 'hi'},
+        ])
+
+    def test_parse_criticality_columns(self):
+        task_set = as_task_set(self.df)
+        self.assertEqual(task_set.hi_criticality.tolist(), [False, True, True])
+        self.assertEqual(task_set.C.tolist(), [1, 2, 4])
+        self.assertEqual(task_set.C_hi.tolist(), [1, 3, 5])
+
+        with self.assertRaises(ValueError):
+            as_task_set(Parser().load_records([{'WCET': 2, 'WCET_HI': 1, 'Period': 4, 'Deadline': 4, 'Criticality': 'HI'}]))
+        with self.assertRaises(ValueError):
+            as_task_set(Parser().load_records([{'WCET': 1, 'Period': 4, 'Deadline': 4, 'Criticality': 'MEDIUM'}]))
+
+    def test_amc_rtb_and_max(self):
+        rtb_schedulable, rtb = amc_rtb_analysis(self.df)
+        max_schedulable, amc_max = amc_max_analysis(self.df)
+
+        self.assertFalse(rtb_schedulable)
+        self.assertTrue(max_schedulable)
+        self.assertEqual(amc_max['R_i_LO'].tolist(), [1, 3, 14])
+        self.assertEqual(rtb['R_i_HI'].tolist(), [0, 4, 21])
+        self.assertEqual(amc_max['R_i_HI'].tolist(), [0, 4, 20])
+        self.assertEqual(rtb['meets_deadline'].tolist(), [True, True, False])
+
+    def test_without_hi_tasks_equals_rta(self):
+        task_set = TaskSet.from_arrays(C=[1, 2, 3], T=[4, 6, 12])
+        order, schedulable, R_lo, R_hi = amc_response_times(task_set)
+        self.assertTrue(schedulable)
+        self.assertEqual(R_lo.tolist(), [1, 3, 10])
+        self.assertEqual(R_hi.tolist(), [0, 0, 0])
+        with self.assertRaises(ValueError):
+            amc_response_times(TaskSet.from_arrays(C=[1], T=[4], J=[1]))
+
+    def test_vectorized_matches_python(self):
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            n = 30
+            T = np.sort(rng.choice(np.arange(10, 2000), n, replace=False))
+            C_hi = np.maximum(1, (rng.dirichlet(np.ones(n)) * 0.6 * T).astype(np.int64))
+            hi = rng.random(n) < 0.5
+            C = np.where(hi, np.maximum(1, C_hi // 2), C_hi)
+            order, schedulable, R_lo, _ = amc_response_times(TaskSet.from_arrays(C=C, T=T, C_hi=C_hi, hi_criticality=hi), 'rtb')
+            if not schedulable and not R_lo.all():
+                continue
+            C, C_hi, T, hi = C[order], C_hi[order], T[order], hi[order]
+            for rtb in (True, False):
+                rows, switch_times = _switch_cases(T.tolist(), T.tolist(), hi.tolist(), R_lo.tolist(), rtb)
+                expected = _python_hi_mode(C.tolist(), C_hi.tolist(), T.tolist(), T.tolist(), hi.tolist(), R_lo.tolist(),
+                                           rows, switch_times, rtb)
+                vectorized = _vectorized_hi_mode(C, C_hi, T, T, hi, R_lo, np.array(rows, dtype=np.intp),
+                                                 np.array(switch_times, dtype=np.int64), rtb)
+                np.testing.assert_array_equal(vectorized, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
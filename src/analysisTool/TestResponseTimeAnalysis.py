@@ -0,0 +1,92 @@
+import unittest
+import numpy as np
+from src.simulatorTool.task_set import TaskSet
+from src.analysisTool.response_time_analysis_RM import compute_response_times, response_times
+from src.analysisTool.demand_analysis_EDF import demand_analysis_edf
+
+
+class TestResponseTimeAnalysis(unittest.TestCase):
+
+    def test_exact_beyond_float_precision(self):
+        # 2**53 + 1 is not a float64, float ceil division would round it away
+        base = 2**53 + 1
+        task_set = TaskSet.from_arrays(C=[base, 1], T=[3 * base, 3 * base + 2])
+
+        order, schedulable, R = response_times(task_set)
+
+        self.assertTrue(schedulable)
+        self.assertEqual(R.dtype, np.int64)
+        self.assertEqual(R.tolist(), [base, base + 1])
+
+    def test_demand_test_exact_utilization(self):
+        # U = 1 + 1e-13 is within float64 rounding of 1, C > T must still fail
+        overloaded = TaskSet.from_arrays(C=[10**13 + 1], T=[10**13])
+        self.assertFalse(demand_analysis_edf(overloaded))
+        self.assertFalse(response_times(overloaded)[1])
+
+        full = TaskSet.from_arrays(C=[10**13 - 1, 1], T=[10**13, 10**13], D=[10**13, 10**13 - 1])
+        self.assertTrue(demand_analysis_edf(full))
+        self.assertFalse(demand_analysis_edf(TaskSet.from_arrays(C=[10**13 - 1, 2], T=[10**13, 10**13])))
+
+    def test_demand_test_exact_beyond_int64(self):
+        overloaded = TaskSet.from_arrays(C=[2**64 + 1], T=[2**64])
+        self.assertEqual(overloaded.C.dtype, object)
+        self.assertFalse(demand_analysis_edf(overloaded))
+        self.assertFalse(response_times(overloaded)[1])
+
+        # U = 1: the jobs fill [0, 2**64], they fit unless both deadlines come before its end
+        self.assertTrue(demand_analysis_edf(TaskSet.from_arrays(C=[2**64 - 2, 2], T=[2**64, 2**64], D=[2**64, 2**64 - 3])))
+        self.assertFalse(demand_analysis_edf(TaskSet.from_arrays(C=[2**64 - 2, 2], T=[2**64, 2**64], D=[2**64 - 2, 2**64 - 3])))
+
+    def test_big_int_fallback_matches_int64(self):
+        small = TaskSet.from_arrays(C=[1, 2, 3], T=[4, 6, 12], D=[4, 5, 12], J=[0, 1, 0])
+        unit = 2**70
+        big = TaskSet.from_arrays(C=small.C.astype(object) * unit, T=small.T.astype(object) * unit,
+                                  D=small.D.astype(object) * unit, J=small.J.astype(object) * unit)
+        self.assertEqual(big.C.dtype, object)
+
+        _, schedulable, R = response_times(small)
+        _, big_schedulable, big_R = response_times(big, reduce_time_unit=False)
+        _, reduced_schedulable, reduced_R = response_times(big)
+
+        self.assertEqual(R.tolist(), [1, 4, 10])
+        self.assertEqual((big_schedulable, big_R.tolist()), (schedulable, [r * unit for r in R.tolist()]))
+        self.assertEqual((reduced_schedulable, reduced_R.tolist()), (big_schedulable, big_R.tolist()))
+
+    def test_time_unit_reduction(self):
+        task_set = TaskSet.from_arrays(C=[1000, 2000], T=[4000, 6000], D=[4000, 5000], J=[0, 500])
+
+        reduced, unit = task_set.reduce_time_unit()
+
+        self.assertEqual(unit, 500)
+        self.assertEqual(reduced.T.tolist(), [8, 12])
+        self.assertEqual(response_times(task_set)[2].tolist(), response_times(task_set, reduce_time_unit=False)[2].tolist())
+        self.assertTrue(demand_analysis_edf(task_set))
+
+        # a BCET the analyses do not read does not block the reduction
+        with_bcet = TaskSet.from_arrays(C=[1000, 2000], T=[4000, 6000], C_min=[1, 1])
+        self.assertEqual(with_bcet.reduce_time_unit()[1], 1)
+        reduced, unit = with_bcet.reduce_time_unit(("C", "T", "D", "J"))
+        self.assertEqual((unit, reduced.C.tolist(), reduced.T.tolist()), (1000, [1, 2], [4, 6]))
+        self.assertEqual(response_times(with_bcet)[2].tolist(), [1000, 3000])
+
+    def test_vectorized_matches_sequential(self):
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            n = 40
+            T = np.sort(rng.integers(10, 10_000, n))
+            C = np.maximum(1, (rng.dirichlet(np.ones(n)) * rng.uniform(0.5, 1.0) * T).astype(np.int64))
+            D = T.copy()
+            J = rng.integers(0, 5, n)
+            vectorized = compute_response_times(C, T, D, J)
+            sequential = compute_response_times(C[:20], T[:20], D[:20], J[:20])
+            floats = compute_response_times(*(array.astype(float) for array in (C, T, D, J)))
+
+            self.assertEqual(vectorized[0], floats[0])
+            np.testing.assert_array_equal(vectorized[1], floats[1])
+            if vectorized[0]:
+                np.testing.assert_array_equal(vectorized[1][:20], sequential[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import tracemalloc
+import unittest
+import pandas as pd
+from src.analysisTool.sensitivity_analysis import analyze_sensitivity
+from src.analysisTool.demand_analysis_EDF import demand_analysis_edf
+
+
+class TestSensitivityAnalysis(unittest.TestCase):
+
+    def test_implicit_deadlines(self):
+        task_set = pd.DataFrame({
+            'task_id': ['A', 'B'],
+            'T_i': [4, 5],
+            'D_i': [4, 5],
+            'C_i': [1, 2],
+        })
+
+        result = analyze_sensitivity(task_set)
+
+        # EDF is schedulable up to U = 1
+        self.assertAlmostEqual(result.edf_breakdown_utilization, 1.0, places=3)
+        # RM: up to alpha = 4/3 R_B = 3 alpha <= 4 (one job of A), beyond it R_B = 4 alpha > 5
+        self.assertAlmostEqual(result.rm_scaling_factor, 4 / 3, places=3)
+
+        max_wcet = result.max_wcet_by_task.set_index('task_id')
+        self.assertEqual(max_wcet.loc['A', 'max_C_i_rm'], 2)
+        self.assertEqual(max_wcet.loc['B', 'max_C_i_rm'], 3)
+        self.assertEqual(max_wcet.loc['B', 'max_C_i_edf'], 3)
+
+    def test_constrained_deadlines_demand(self):
+        schedulable = pd.DataFrame({'T_i': [4, 6], 'D_i': [2, 6], 'C_i': [2, 2]})
+        unschedulable = pd.DataFrame({'T_i': [4, 6], 'D_i': [2, 3], 'C_i': [2, 2]})
+
+        self.assertTrue(demand_analysis_edf(schedulable))
+        self.assertFalse(demand_analysis_edf(unschedulable))
+
+    def test_demand_deadlines_are_generated_lazily(self):
+        # U = 1 and a constrained deadline: L is the hyperperiod ~1e9 with ~2e6 deadlines to check
+        task_set = pd.DataFrame({'T_i': [1000, 2002, 2006], 'D_i': [1000, 2002, 1000], 'C_i': [500, 1001, 0]})
+        tracemalloc.start()
+        try:
+            self.assertTrue(demand_analysis_edf(task_set))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 2**21)
+
+    def test_release_jitter_demand(self):
+        # a job of task 1 can be released 6 after its activation and has only D_1 - J_1 = 2 left
+        task_set = pd.DataFrame({'task_id': ['1', '2', '3'], 'T_i': [8, 8, 12], 'D_i': [8, 8, 12],
+                                 'J_i': [6, 3, 1], 'C_i': [6, 1, 1]})
+        self.assertFalse(demand_analysis_edf(task_set))
+        self.assertTrue(demand_analysis_edf(task_set.assign(C_i=[2, 1, 1])))
+        self.assertFalse(demand_analysis_edf(task_set.assign(C_i=[3, 1, 1])))
+
+        max_wcet = analyze_sensitivity(task_set.assign(C_i=[1, 1, 1])).max_wcet_by_task.set_index('task_id')
+        self.assertEqual(max_wcet.loc['1', 'max_C_i_edf'], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Union
+
+import numpy as np
+
+from src.analysisTool.response_time_analysis_RM import (VECTORIZE_FROM_TASKS, checked_integer_arrays,
+                                                        compute_response_times, integer_array)
+from src.simulatorTool.task_set import TaskSet, as_task_set
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+AMC_RTB = "rtb"
+AMC_MAX = "max"
+
+# (task, mode switch time) cases per numpy block, bounds memory to block * n_tasks values.
+_BLOCK_SIZE = 4096
+# AMC-max of a small task set can still have many mode switch times, vectorize over them from here on.
+_VECTORIZE_FROM_CASES = 16
+
+
+def amc_analysis(df: Union[TaskSet, pd.DataFrame], method: str = AMC_MAX) -> tuple[bool, pd.DataFrame]:
+    """
+    Adaptive Mixed Criticality analysis of a dual-criticality task set under
+    deadline monotonic priorities (Baruah, Burns, Davis 2011).
+    Every task has to meet its deadline in LO mode (R_i_LO, the RTA with the
+    LO-level WCETs C_i), HI tasks also when the system switches to HI mode and
+    drops the LO tasks (R_i_HI, by AMC-rtb or the tighter AMC-max).
+    Accepts a TaskSet or a DataFrame, results are in priority order like those
+    of `response_time_analysis_rta`; R_i_HI is 0 for LO tasks.
+    Returns: (schedulable, results_df)
+    """
+    task_set = as_task_set(df)
+    order, schedulable, R_lo, R_hi = amc_response_times(task_set, method)
+
+    if isinstance(df, TaskSet):
+        results = task_set.take(order).to_dataframe()
+    else:
+        results = df.iloc[order].reset_index(drop=True)
+    results["R_i_LO"] = R_lo
+    results["R_i_HI"] = R_hi
+    results["meets_deadline"] = (results["R_i_LO"] <= results["D_i"]) & (results["R_i_HI"] <= results["D_i"])
+
+    return schedulable, results
+
+
+def amc_rtb_analysis(df: Union[TaskSet, pd.DataFrame]) -> tuple[bool, pd.DataFrame]:
+    return amc_analysis(df, AMC_RTB)
+
+
+def amc_max_analysis(df: Union[TaskSet, pd.DataFrame]) -> tuple[bool, pd.DataFrame]:
+    return amc_analysis(df, AMC_MAX)
+
+
+def amc_response_times(task_set: TaskSet, method: str = AMC_MAX,
+                       reduce_time_unit: bool = True) -> tuple[np.ndarray, bool, np.ndarray, np.ndarray]:
+    """
+    AMC on the arrays of a TaskSet, in exact integers like `response_times`.
+    If a task misses its deadline in LO mode, HI mode is not analysed (R_HI = 0).
+    Returns: (order, schedulable, R_LO, R_HI) with entry k for task order[k]
+    """
+    if method not in (AMC_RTB, AMC_MAX):
+        raise ValueError(f"Unknown AMC method '{method}', expected '{AMC_RTB}' or '{AMC_MAX}'")
+    if task_set.J.any():
+        raise ValueError("AMC analysis does not support release jitter")
+
+    order = task_set.priority_order()
+    unit = 1
+    if reduce_time_unit:
+        task_set, unit = task_set.reduce_time_unit(("C", "C_hi", "T", "D", "J"))
+    # C_hi >= C, so the overflow bound for C_hi covers both levels
+    C_hi, T, D, J = checked_integer_arrays(task_set.C_hi[order], task_set.T[order], task_set.D[order], task_set.J[order])
+    C = task_set.C[order].astype(C_hi.dtype)
+    hi = task_set.hi_criticality[order]
+
+    schedulable, R_lo = compute_response_times(C, T, D, J)
+    R_hi = np.zeros(len(C), dtype=R_lo.dtype)
+    if schedulable and hi.any():
+        schedulable, R_hi = hi_mode_response_times(C, C_hi, T, D, hi, R_lo, method)
+
+    if unit > 1:
+        R_lo = integer_array([r * unit for r in R_lo.tolist()])
+        R_hi = integer_array([r * unit for r in R_hi.tolist()])
+    return order, schedulable, R_lo, R_hi
+
+
+def hi_mode_response_times(C: np.ndarray, C_hi: np.ndarray, T: np.ndarray, D: np.ndarray, hi: np.ndarray,
+                           R_lo: np.ndarray, method: str = AMC_MAX) -> tuple[bool, np.ndarray]:
+    """
+    Response times of the HI tasks across a mode switch at time s after their release,
+    tasks sorted by priority and R_lo their LO-mode response times:
+
+        R_i(s) = C_i_HI + sum_{k in hpL(i)} (floor(s / T_k) + 1) C_k
+                        + sum_{j in hpH(i)} M_j C_j_HI + (ceil(R_i(s) / T_j) - M_j) C_j
+
+    AMC-max takes the maximum over the releases s < R_i_LO of LO tasks, with
+    M_j = min(ceil((R_i(s) - s - (T_j - D_j)) / T_j) + 1, ceil(R_i(s) / T_j))
+    jobs of j released in HI mode. AMC-rtb bounds it by a single case with all
+    jobs of hpH(i) at C_j_HI and every LO job released before R_i_LO.
+    R_HI is at least R_LO, the job may also finish before the switch.
+    Small task sets iterate on Python ints, larger ones vectorized over all
+    (task, s) cases. Returns: (schedulable, R_HI), R_HI = 0 for LO tasks
+    """
+    rtb = method == AMC_RTB
+    lists = [array.tolist() for array in (C, C_hi, T, D, hi, R_lo)]
+    rows, switch_times = _switch_cases(*lists[2:], rtb)
+    if len(C) < VECTORIZE_FROM_TASKS and len(rows) < _VECTORIZE_FROM_CASES:
+        R_hi = _python_hi_mode(*lists, rows, switch_times, rtb)
+    else:
+        R_hi = _vectorized_hi_mode(C, C_hi, T, D, hi, R_lo, np.array(rows, dtype=np.intp),
+                                   np.array(switch_times, dtype=C.dtype), rtb)
+    schedulable = bool(np.all(R_hi[hi] <= D[hi]))
+    return schedulable, R_hi
+
+
+def _switch_cases(T: list, D: list, hi: list, R_lo: list, rtb: bool) -> tuple[list, list]:
+    """(task, s) pairs to analyse; for AMC-rtb s = R_i_LO - 1 counts every LO job released before R_i_LO."""
+    rows, switch_times = [], []
+    for i in range(len(T)):
+        if not hi[i]:
+            continue
+        if rtb:
+            times = [R_lo[i] - 1]
+        else:
+            times = {0}
+            for k in range(i):
+                if not hi[k]:
+                    times.update(range(T[k], R_lo[i], T[k]))
+            times = sorted(times)
+        rows += [i] * len(times)
+        switch_times += times
+    return rows, switch_times
+
+
+def _python_hi_mode(C: list, C_hi: list, T: list, D: list, hi: list, R_lo: list,
+                    rows: list, switch_times: list, rtb: bool) -> np.ndarray:
+    R_hi = [0] * len(C)
+    for case, (i, s) in enumerate(zip(rows, switch_times)):
+        if case == 0 or rows[case - 1] != i:
+            lo_tasks = [k for k in range(i) if not hi[k]]
+            hi_tasks = [j for j in range(i) if hi[j]]
+            R_hi[i] = R_lo[i]
+        base = C_hi[i] + sum((s // T[k] + 1) * C[k] for k in lo_tasks)
+
+        def step(t: int) -> int:
+            total = base
+            for j in hi_tasks:
+                releases = -(-t // T[j])
+                hi_jobs = releases if rtb else min(-(-(t - s - T[j] + D[j]) // T[j]) + 1, releases)
+                total += releases * C[j] + hi_jobs * (C_hi[j] - C[j])
+            return total
+
+        # the iteration starts at R_i_LO <= R_hi[i] and is monotone, so if one step
+        # from R_hi[i] does not increase it, R_i(s) <= R_hi[i] and s can be skipped
+        if step(R_hi[i]) <= R_hi[i]:
+            continue
+        # starts at R_i_LO > s, goes monotonically up or down and ends at a fixed point or a miss
+        t = R_lo[i]
+        while True:
+            t_new = step(t)
+            if t_new == t or t_new > D[i]:
+                t = t_new
+                break
+            t = t_new
+        R_hi[i] = max(R_hi[i], t)
+    return integer_array(R_hi)
+
+
+def _vectorized_hi_mode(C: np.ndarray, C_hi: np.ndarray, T: np.ndarray, D: np.ndarray, hi: np.ndarray,
+                        R_lo: np.ndarray, rows: np.ndarray, switch_times: np.ndarray, rtb: bool) -> np.ndarray:
+    n = len(C)
+    higher_priority = np.tri(n, n, -1, dtype=bool)
+    # LO interference only depends on s, HI interference only involves the HI tasks (columns h)
+    h = np.flatnonzero(hi)
+    hp_hi = higher_priority[:, h]
+    hp_lo = higher_priority & ~hi
+    C_h, extra_h, T_h, slack_h = C[h], C_hi[h] - C[h], T[h], T[h] - D[h]
+    R_hi = np.zeros(n, dtype=C.dtype)
+    R_hi[h] = R_lo[h]
+
+    def step(t: np.ndarray, s: np.ndarray, base: np.ndarray, r: np.ndarray) -> np.ndarray:
+        window = t[:, None]
+        releases = -(-window // T_h)
+        hi_jobs = releases if rtb else np.minimum(-(-(window - s[:, None] - slack_h) // T_h) + 1, releases)
+        return base + ((releases * C_h + hi_jobs * extra_h) * hp_hi[r]).sum(axis=1)
+
+    for start in range(0, len(rows), _BLOCK_SIZE):
+        r = rows[start:start + _BLOCK_SIZE]
+        s = switch_times[start:start + _BLOCK_SIZE]
+        base = C_hi[r] + ((s[:, None] // T + 1) * hp_lo[r]) @ C
+        # R_i(s) <= R_hi[i] if one step from R_hi[i] does not increase it, see _python_hi_mode
+        new = step(R_hi[r], s, base, r) > R_hi[r]
+        r, s, base = r[new], s[new], base[new]
+
+        t = R_lo[r].copy()
+        active = np.ones(len(r), dtype=bool)
+        while active.any():
+            cases = np.flatnonzero(active)
+            t_new = step(t[cases], s[cases], base[cases], r[cases])
+            done = (t_new == t[cases]) | (t_new > D[r[cases]])
+            t[cases] = t_new
+            active[cases[done]] = False
+        np.maximum.at(R_hi, r, t)
+    return R_hi
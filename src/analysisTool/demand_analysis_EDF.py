@@ -0,0 +1,111 @@
+from __future__ import annotations
+import math
+from fractions import Fraction
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+
+from src.simulatorTool.task_set import TaskSet, as_task_set
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Deadlines generated and checked per time window (numpy block), bounds memory to about block * n_tasks values.
+_BLOCK_SIZE = 4096
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def processor_demand_test(C: np.ndarray, T: np.ndarray, D: np.ndarray, J: Optional[np.ndarray] = None) -> bool:
+    """
+    Processor demand criterion for EDF (Buttazzo Sec. 4.6.1, Baruah et al.)
+    with release jitter J (0 if not given): the task set is schedulable iff
+    U <= 1 and dbf(t) <= t for every t <= L at which the demand steps, with
+    dbf(t) = sum_i max(0, floor((t + J_i - D_i) / T_i) + 1) * C_i.
+    A job released J_i late still has its deadline D_i after the activation,
+    so the first step of task i is at D_i - J_i and the next every T_i.
+    On integer arrays (int64 or object arrays of Python ints) U and L are
+    exact fractions and the deadlines and floor divisions exact integers
+    (Python ints if a parameter or the demand up to L could overflow int64),
+    float arrays are tested in float64.
+    The deadlines are generated window by window, never all at once: with
+    U = 1 and D < T, L is the hyperperiod.
+    """
+    if J is None:
+        J = np.zeros_like(T)
+    exact = all(array.dtype == np.int64 or array.dtype == object for array in (C, T, D, J))
+    U = _utilization(C, T, exact)
+    if U > (1 if exact else 1.0 + 1e-12):
+        return False
+    first = D - J
+    # a job whose jitter leaves it no time before its deadline
+    if np.any((first <= 0) & (C > 0)):
+        return False
+    if np.all(first >= T):
+        return True
+
+    L = _demand_bound_interval(C, T, D, J, U)
+
+    dtype = np.int64 if exact else float
+    # dbf(t) <= U t + sum C_i, so below this bound int64 cannot overflow
+    big = any(array.dtype == object for array in (C, T, first))
+    if exact and (big or L + sum(int(c) for c in C) > _INT64_MAX):
+        dtype = object
+        C, T, first = C.astype(object), T.astype(object), first.astype(object)
+
+    # demand steps D_i - J_i + k T_i up to L, in windows holding about _BLOCK_SIZE of them
+    steps = [(int(d), int(t)) for d, t in zip(first, T) if d > 0]
+    if not steps:
+        return True
+    width = max(1, int(_BLOCK_SIZE / sum(1 / t for _, t in steps)))
+    for window_start in range(min(d for d, _ in steps), L + 1, width):
+        window_end = min(window_start + width, L + 1)
+        t = np.unique(np.concatenate([
+            _arange(d + max(0, -(-(window_start - d) // period)) * period, window_end, period, dtype)
+            for d, period in steps
+        ]))[:, None]
+        jobs = np.maximum(0, (t - first) // T + 1) if exact else np.maximum(0.0, np.floor((t - first) / T) + 1)
+        demand = jobs @ C
+        if np.any(demand > t[:, 0]):
+            return False
+    return True
+
+
+def _arange(start: int, stop: int, step: int, dtype: type) -> np.ndarray:
+    if dtype is object:
+        return np.array(range(start, stop, step), dtype=object)
+    return np.arange(start, stop, step, dtype=dtype)
+
+
+def demand_analysis_edf(df: Union[TaskSet, pd.DataFrame]) -> bool:
+    """Processor demand test on a TaskSet or a task set DataFrame with C_i, T_i, D_i (and J_i).
+
+    Runs on the GCD-reduced integer parameters, exact also beyond int64 (in Python ints).
+    """
+    task_set, _ = as_task_set(df).reduce_time_unit(("C", "T", "D", "J"))
+    return processor_demand_test(task_set.C, task_set.T, task_set.D, task_set.J)
+
+
+def _utilization(C: np.ndarray, T: np.ndarray, exact: bool) -> Union[Fraction, float]:
+    """U as an exact Fraction on integer arrays, else in float64."""
+    if exact:
+        return sum((Fraction(int(c), int(t)) for c, t in zip(C, T)), Fraction(0))
+    return float(np.sum(C / T))
+
+
+def _demand_bound_interval(C: np.ndarray, T: np.ndarray, D: np.ndarray, J: np.ndarray,
+                           U: Union[Fraction, float]) -> int:
+    """
+    floor(L) of the interval that has to be checked: L* = sum (T_i - D_i + J_i) U_i / (1 - U)
+    for U < 1, at most the hyperperiod, after which dbf(t) - t repeats (shifted by the
+    latest first deadline beyond T_i, before it the max(0, ...) terms are not yet periodic).
+    L* is an exact Fraction if U is one.
+    """
+    first = D - J
+    bound = math.lcm(*(int(t) for t in T)) + max(0, int(np.max(first - T)))
+    if U >= 1:
+        return bound
+    if isinstance(U, Fraction):
+        l_star = sum(Fraction((int(t) - int(f)) * int(c), int(t)) for c, t, f in zip(C, T, first)) / (1 - U)
+    else:
+        l_star = float(np.sum((T - first) * (C / T)) / (1.0 - U))
+    return min(bound, max(int(np.max(first)), math.floor(l_star)))
@@ -1,57 +1,150 @@
+from __future__ import annotations
 import numpy as np
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, Union
 from src.misc.parser import Parser
+from src.simulatorTool.task_set import INT64_MAX, TaskSet, as_task_set
 
-def response_time_analysis_rta(df: pd.DataFrame) -> tuple[bool, pd.DataFrame]:
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Below this many tasks the per-call overhead of numpy outweighs vectorizing over the tasks.
+VECTORIZE_FROM_TASKS = 24
+
+def response_time_analysis_rta(df: Union[TaskSet, pd.DataFrame]) -> tuple[bool, pd.DataFrame]:
     """
     Worst-case response time analysis (Buttazzo Eq. 4.19, Fig. 4.17).
+    If the task set has a release jitter column J_i, the jitter-aware
+    recurrence w_i = C_i + sum_j ceil((w_i + J_j) / T_j) * C_j is used and
+    R_i = w_i + J_i, measured from the activation like in the simulator.
+    Accepts a TaskSet or a DataFrame; the results are a DataFrame for reporting,
+    use `response_times` to stay on arrays.
     Returns: (schedulable, results_df)
     """
-    required = {"C_i", "T_i", "D_i"}
-    missing = required - set(df.columns)
-    if missing:
-        raise ValueError(f"Taskset missing required columns: {sorted(missing)}")
+    task_set = as_task_set(df)
+    order, schedulable, R = response_times(task_set)
 
-    work = df.sort_values(by=["D_i", "T_i"]).reset_index(drop=True)
+    if isinstance(df, TaskSet):
+        results = task_set.take(order).to_dataframe()
+    else:
+        results = df.iloc[order].reset_index(drop=True)
+    results["R_i"] = R
+    results["meets_deadline"] = results["R_i"] <= results["D_i"]
 
-    C = work["C_i"].to_numpy(dtype=float)
-    T = work["T_i"].to_numpy(dtype=float)
-    D = work["D_i"].to_numpy(dtype=float)
+    return schedulable, results
 
-    R = np.zeros(len(work), dtype=float)
-    schedulable = True
 
-    for i in range(len(work)):
-        Ri = C[i]  # initial guess
+def response_times(task_set: TaskSet, reduce_time_unit: bool = True) -> tuple[np.ndarray, bool, np.ndarray]:
+    """
+    Exact integer RTA on the arrays of a TaskSet, tasks in deadline monotonic order.
+    With `reduce_time_unit` the parameters are divided by their GCD first and the
+    response times multiplied back, which keeps large periods within int64.
+    Returns: (order, schedulable, R) with R[k] the response time of task order[k]
+    """
+    order = task_set.priority_order()
+    unit = 1
+    if reduce_time_unit:
+        task_set, unit = task_set.reduce_time_unit(("C", "T", "D", "J"))
+    C, T, D, J = checked_integer_arrays(task_set.C[order], task_set.T[order], task_set.D[order], task_set.J[order])
+    schedulable, R = compute_response_times(C, T, D, J)
+    if unit > 1:
+        R = integer_array([r * unit for r in R.tolist()])
+    return order, schedulable, R
+
+
+def compute_response_times(C: np.ndarray, T: np.ndarray, D: np.ndarray, J: np.ndarray,
+                           initial: Optional[np.ndarray] = None) -> tuple[bool, np.ndarray]:
+    """
+    Fixed-point iteration of the RTA recurrence for tasks already sorted by priority,
+    vectorized over the tasks: each step updates every task that has neither
+    converged nor missed its deadline. Integer arrays (int64 or object arrays of
+    Python ints) use exact integer ceil division, float arrays (e.g. scaled C in
+    the sensitivity analysis) np.ceil.
+    `initial` can hold response times known to be lower bounds (e.g. of the same
+    task set with smaller C), the iteration then starts from them instead of C_i.
+    Stops at the first deadline miss, later tasks keep R_i = 0.
+    Returns: (schedulable, R)
+    """
+    n = len(C)
+    exact = all(array.dtype.kind in "iuO" for array in (C, T, D, J))
+    if exact and n < VECTORIZE_FROM_TASKS:
+        return _python_response_times(C.tolist(), T.tolist(), D.tolist(), J.tolist(),
+                                      None if initial is None else initial.tolist())
+
+    w = C.copy()
+    if initial is not None:
+        w = np.maximum(w, initial - J)
+    higher_priority = np.tri(n, n, -1, dtype=bool)  # [i, j]: task j has a higher priority than task i
+    active = np.ones(n, dtype=bool)
+    missed = np.zeros(n, dtype=bool)
+
+    while active.any():
+        rows = np.flatnonzero(active)
+        window = w[rows, None] + J
+        releases = -(-window // T) if exact else np.ceil(window / T)
+        w_new = C[rows] + (releases * higher_priority[rows]) @ C
+
+        miss = w_new + J[rows] > D[rows]
+        converged = w_new <= w[rows]
+        w[rows] = w_new
+        active[rows[miss | converged]] = False
+        if miss.any():
+            # tasks below the first miss are not analysed (R_i = 0)
+            first_miss = rows[np.argmax(miss)]
+            missed[first_miss] = True
+            active[first_miss:] = False
+
+    R = w + J
+    schedulable = not missed.any()
+    if not schedulable:
+        R[np.argmax(missed) + 1:] = 0
+    return schedulable, R
+
+
+def _python_response_times(C: list, T: list, D: list, J: list, initial: Optional[list]) -> tuple[bool, np.ndarray]:
+    """Same recurrence on Python ints, one task at a time; faster than numpy for a few tasks."""
+    n = len(C)
+    R = [0] * n
+    schedulable = True
+    for i in range(n):
+        w = C[i] if initial is None else max(C[i], initial[i] - J[i])
         while True:
-            Rold = Ri
-
-            if i == 0:
-                interference = 0.0
-            else:
-                interference = np.sum(np.ceil(Rold / T[:i]) * C[:i])
-
-            Ri = C[i] + interference
-
-            # Deadline miss => not schedulable
-            if Ri > D[i]:
+            w_new = C[i] + sum(-(-(w + J[j]) // T[j]) * C[j] for j in range(i))
+            if w_new + J[i] > D[i]:
                 schedulable = False
+                w = w_new
                 break
-
-            # Converged (fixed point reached)
-            if Ri <= Rold:
+            if w_new <= w:
                 break
-
-        R[i] = Ri
-
+            w = w_new
+        R[i] = w + J[i]
         if not schedulable:
             break
+    return schedulable, integer_array(R)
 
-    results = work.copy()
-    results["R_i"] = R
-    results["meets_deadline"] = results["R_i"] <= results["D_i"]
 
-    return schedulable, results
+def integer_array(values: list) -> np.ndarray:
+    """int64 array of Python ints if they fit, else an object array."""
+    if all(-INT64_MAX - 1 <= value <= INT64_MAX for value in values):
+        return np.array(values, dtype=np.int64)
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def checked_integer_arrays(C: np.ndarray, T: np.ndarray, D: np.ndarray, J: np.ndarray) -> list[np.ndarray]:
+    """int64 arrays if no intermediate value of the recurrence can overflow, else Python int (object) arrays.
+
+    While a task is iterated w_i + J_i <= max(D_i, C_i + J_i), so every value
+    stays below that window plus sum_j (window // T_j + 2) * C_j.
+    """
+    arrays = [C, T, D, J]
+    if all(array.dtype == np.int64 for array in arrays) and len(C):
+        # estimated in float64 with a factor 2 margin for its rounding
+        window = float(max(D.max(), C.max())) + float(J.max())
+        bound = window + float(((window / T + 2) * C).sum())
+        if 2 * bound <= INT64_MAX:
+            return arrays
+    return [array.astype(object) for array in arrays]
 
 
 def analyze_taskset(csv_path: str) -> tuple[bool, pd.DataFrame]:
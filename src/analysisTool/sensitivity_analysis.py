@@ -0,0 +1,137 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from src.analysisTool.demand_analysis_EDF import processor_demand_test
+from src.analysisTool.response_time_analysis_RM import compute_response_times
+from src.simulatorTool.task_set import TaskSet, as_task_set
+
+
+@dataclass(frozen=True)
+class SensitivityResult:
+    task_set_name: str
+    util: float
+
+    # largest factor alpha so that alpha * C_i for all tasks is still schedulable
+    rm_scaling_factor: float
+    edf_scaling_factor: float
+    rm_breakdown_utilization: float
+    edf_breakdown_utilization: float
+
+    # per task: task_id, C_i, max_C_i_rm, max_C_i_edf (others unchanged)
+    max_wcet_by_task: pd.DataFrame
+
+
+class _RMSearch:
+    """RTA feasibility with warm starts.
+
+    Response times only grow with C, so the response times of the last
+    feasible point of a bisection are valid initial values for every larger
+    candidate and skip most of the fixed-point iterations.
+    """
+
+    def __init__(self, C: np.ndarray, T: np.ndarray, D: np.ndarray, J: np.ndarray) -> None:
+        self.C, self.T, self.D, self.J = C, T, D, J
+        self.feasible_R: Optional[np.ndarray] = None
+
+    def reset(self) -> None:
+        self.feasible_R = None
+
+    def is_schedulable(self, C: np.ndarray) -> bool:
+        schedulable, R = compute_response_times(C, self.T, self.D, self.J, self.feasible_R)
+        if schedulable:
+            self.feasible_R = R
+        return schedulable
+
+
+def analyze_sensitivity(df: Union[TaskSet, pd.DataFrame], tolerance: float = 1e-4) -> SensitivityResult:
+    """
+    Breakdown utilization and maximum WCET per task under RM (RTA) and EDF (demand analysis).
+    Tasks are ordered like in response_time_analysis_rta (by D_i, then T_i).
+    """
+    task_set = as_task_set(df)
+    work = task_set.take(task_set.priority_order())
+
+    C = work.C.astype(float)
+    T = work.T.astype(float)
+    D = work.D.astype(float)
+    J = work.J.astype(float)
+    util = float(np.sum(C / T))
+
+    rm = _RMSearch(C, T, D, J)
+    rm_alpha = _max_scaling_factor(C, util, rm.is_schedulable, tolerance)
+    edf_alpha = _max_scaling_factor(C, util, lambda scaled: processor_demand_test(scaled, T, D, J), tolerance)
+
+    max_rm, max_edf = [], []
+    for i in range(len(work)):
+        rm.reset()
+        max_rm.append(_max_wcet(C, D, i, rm.is_schedulable))
+        max_edf.append(_max_wcet(C, D, i, lambda candidate: processor_demand_test(candidate, T, D, J)))
+
+    max_wcet_by_task = pd.DataFrame({
+        "task_id": work.ids,
+        "C_i": work.C,
+        "max_C_i_rm": max_rm,
+        "max_C_i_edf": max_edf,
+    })
+
+    return SensitivityResult(
+        task_set_name=task_set.name,
+        util=util,
+        rm_scaling_factor=rm_alpha,
+        edf_scaling_factor=edf_alpha,
+        rm_breakdown_utilization=rm_alpha * util,
+        edf_breakdown_utilization=edf_alpha * util,
+        max_wcet_by_task=max_wcet_by_task,
+    )
+
+
+def analyze_corpus_sensitivity(dfs: list[Union[TaskSet, pd.DataFrame]], max_workers: Optional[int] = None) -> list[SensitivityResult]:
+    """Run `analyze_sensitivity` for every task set in parallel worker processes."""
+    dfs = [as_task_set(df) for df in dfs]
+    if len(dfs) <= 1 or max_workers == 1:
+        return [analyze_sensitivity(df) for df in dfs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(analyze_sensitivity, dfs))
+
+
+def _max_scaling_factor(C: np.ndarray, util: float, is_schedulable: Callable[[np.ndarray], bool],
+                        tolerance: float) -> float:
+    """Bisection on alpha in [0, 1/U]; beyond 1/U the utilization exceeds 1."""
+    if util <= 0:
+        return float("inf")
+    lo, hi = 0.0, 1.0 / util
+    if is_schedulable(C * hi):
+        return hi
+    while hi - lo > tolerance:
+        mid = (lo + hi) / 2
+        if is_schedulable(C * mid):
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def _max_wcet(C: np.ndarray, D: np.ndarray, i: int, is_schedulable: Callable[[np.ndarray], bool]) -> int:
+    """Largest integer C_i in [0, D_i] keeping the set schedulable, -1 if even C_i = 0 fails."""
+    candidate = C.copy()
+
+    def feasible(c: int) -> bool:
+        candidate[i] = c
+        return is_schedulable(candidate)
+
+    lo, hi = 0, int(D[i])
+    if not feasible(lo):
+        return -1
+    if feasible(hi):
+        return hi
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if feasible(mid):
+            lo = mid
+        else:
+            hi = mid
+    return lo
@@ -0,0 +1,243 @@
+import argparse
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.analysisTool.demand_analysis_EDF import demand_analysis_edf
+from src.analysisTool.response_time_analysis_RM import response_time_analysis_rta
+from src.simulatorTool.earliest_deadline_first import EDF
+from src.simulatorTool.rate_monotonic import RateMonotonic
+from src.simulatorTool.simulator import Simulator, TaskSetMetrics
+
+# Divisors of 120, so hyperperiods stay small enough for the tick-by-tick reference.
+PERIODS = (2, 3, 4, 5, 6, 8, 10, 12, 15, 20, 24, 30, 40, 60)
+
+# task_id -> sorted (activation, finish) of every job
+Schedule = Dict[Any, List[Tuple[int, int]]]
+
+
+@dataclass(frozen=True)
+class Discrepancy:
+    case: int
+    task_set: pd.DataFrame
+    messages: List[str]
+
+
+def random_task_set(rng: np.random.Generator, max_tasks: int = 6, periods: Tuple[int, ...] = PERIODS) -> pd.DataFrame:
+    """Synchronous periodic task set with utilization around 0.3..1.2 (UUniFast).
+
+    Half of the task sets get constrained deadlines D_i = ceil(f * T_i) with
+    one f for all tasks, so deadline monotonic (RTA order) and rate monotonic
+    (simulator order) agree.
+    """
+    n = int(rng.integers(1, max_tasks + 1))
+    T = rng.choice(periods, size=n)
+    remaining = rng.uniform(0.3, 1.2)
+    shares = []
+    for i in range(1, n):
+        rest = remaining * rng.random() ** (1 / (n - i))
+        shares.append(remaining - rest)
+        remaining = rest
+    shares.append(remaining)
+    C = np.clip(np.rint(np.array(shares) * T), 1, T).astype(int)
+    D = T if rng.random() < 0.5 else np.maximum(C, np.ceil(rng.uniform(0.5, 1.0) * T)).astype(int)
+    return _task_set(C, T, np.minimum(D, T))
+
+
+def reference_schedule(task_set: pd.DataFrame, algorithm: str, amountOfHyperPeriods: int = 1) -> Schedule:
+    """Tick-by-tick RM or EDF schedule, written for obviousness rather than speed.
+
+    Tie-breaking follows the simulator: RM picks the shortest period, then the
+    shortest deadline, the task order and the earliest activation; EDF picks the
+    earliest deadline, prefers the job that ran in the last tick and then takes
+    the shortest period, the earliest activation and the task order.
+    """
+    ids = task_set["task_id"].tolist()
+    C = [int(c) for c in task_set["C_i"]]
+    T = [int(t) for t in task_set["T_i"]]
+    D = [int(d) for d in task_set["D_i"]]
+    horizon = math.lcm(*T) * amountOfHyperPeriods
+    releases = sorted((a, i) for i in range(len(T)) for a in range(0, horizon, T[i]))
+
+    schedule: Schedule = {task_id: [] for task_id in ids}
+    pending: List[list] = []  # [activation, task index, remaining]
+    next_release = 0
+    last = None
+    t = 0
+    while next_release < len(releases) or pending:
+        while next_release < len(releases) and releases[next_release][0] <= t:
+            a, i = releases[next_release]
+            pending.append([a, i, C[i]])
+            next_release += 1
+        if not pending:
+            t = releases[next_release][0]
+            continue
+
+        if algorithm == "RM":
+            job = min(pending, key=lambda j: (T[j[1]], D[j[1]], j[1], j[0]))
+        else:
+            earliest = min(j[0] + D[j[1]] for j in pending)
+            ties = [j for j in pending if j[0] + D[j[1]] == earliest]
+            job = last if last in ties else min(ties, key=lambda j: (T[j[1]], j[0], j[1]))
+
+        job[2] -= 1
+        t += 1
+        last = job
+        if job[2] == 0:
+            pending.remove(job)
+            schedule[ids[job[1]]].append((job[0], t))
+            last = None
+
+    return {task_id: sorted(jobs) for task_id, jobs in schedule.items()}
+
+
+def check_task_set(task_set: pd.DataFrame, amountOfHyperPeriods: int = 3, rm: Any = None, edf: Any = None) -> List[str]:
+    """Differences between RTA, the processor demand test, the simulator and the reference; empty if none.
+
+    * simulator == reference, job by job, for RM and EDF
+    * RM: simulated WCRT == RTA R_i for every task RTA finds schedulable (and
+      for all tasks of higher priority than the first one that misses), and
+      the simulator sees a deadline miss iff RTA does
+    * EDF: the simulator sees a deadline miss iff the demand test fails
+    """
+    messages = []
+    rm_metrics = Simulator().start(task_set, rm or RateMonotonic(), True, amountOfHyperPeriods)
+    edf_metrics = Simulator().start(task_set, edf or EDF(), True, amountOfHyperPeriods)
+
+    for name, metrics in [("RM", rm_metrics), ("EDF", edf_metrics)]:
+        simulated = _schedule(metrics, task_set)
+        expected = reference_schedule(task_set, name, amountOfHyperPeriods)
+        for task_id in expected:
+            if simulated[task_id] != expected[task_id]:
+                first = next((s, e) for s, e in zip(simulated[task_id] + [None], expected[task_id] + [None]) if s != e)
+                messages.append(f"{name} task {task_id}: simulator job (activation, finish) {first[0]}, reference {first[1]}")
+
+    rta_schedulable, rta = response_time_analysis_rta(task_set)
+    wcrt = _wcrt(rm_metrics)
+    misses = rta[~rta["meets_deadline"]]
+    # tasks with the period of the first miss may queue behind its late jobs (FIFO among equal priorities)
+    first_miss_period = misses["T_i"].iloc[0] if len(misses) else math.inf
+    for task in rta.itertuples():
+        if task.meets_deadline and task.T_i < first_miss_period and wcrt[task.task_id] != task.R_i:
+            messages.append(f"RM task {task.task_id}: simulated WCRT {wcrt[task.task_id]}, RTA R_i {task.R_i:g}")
+    if rta_schedulable != rm_metrics.is_scheduable_simulator:
+        messages.append(f"RM: RTA schedulable {rta_schedulable}, simulator schedulable {rm_metrics.is_scheduable_simulator}")
+
+    demand_schedulable = demand_analysis_edf(task_set)
+    if demand_schedulable != edf_metrics.is_scheduable_simulator:
+        messages.append(f"EDF: demand test schedulable {demand_schedulable}, simulator schedulable {edf_metrics.is_scheduable_simulator}")
+
+    return messages
+
+
+def shrink(task_set: pd.DataFrame, fails: Callable[[pd.DataFrame], bool]) -> pd.DataFrame:
+    """Greedily simplify a failing task set while `fails` stays true.
+
+    Tries, until nothing changes: dropping a task, halving or decrementing a
+    C_i, relaxing a D_i to T_i and replacing a T_i by a smaller period from
+    PERIODS (C_i and D_i clipped to it).
+    """
+    current = task_set.reset_index(drop=True)
+    changed = True
+    while changed:
+        changed = False
+        for candidate in _simplifications(current):
+            if fails(candidate):
+                current = candidate
+                changed = True
+                break
+    return current
+
+
+def run(count: int, seed: int = 0, max_workers: Optional[int] = None, amountOfHyperPeriods: int = 3,
+        max_tasks: int = 6) -> List[Discrepancy]:
+    """Check `count` random task sets in parallel, returns the failing ones shrunk to a minimal task set."""
+    chunks = [range(start, min(start + 64, count)) for start in range(0, count, 64)]
+    failures = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for chunk_failures in pool.map(_check_chunk, [(seed, chunk, amountOfHyperPeriods, max_tasks) for chunk in chunks]):
+            failures.extend(chunk_failures)
+
+    discrepancies = []
+    for case in failures:
+        task_set = shrink(random_task_set(_rng(seed, case), max_tasks),
+                          lambda candidate: bool(check_task_set(candidate, amountOfHyperPeriods)))
+        discrepancies.append(Discrepancy(case, task_set, check_task_set(task_set, amountOfHyperPeriods)))
+    return discrepancies
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Differential test: RTA / demand test vs. simulator vs. reference scheduler")
+    arg_parser.add_argument("--count", type=int, default=10_000, help="number of random task sets")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--workers", type=int, default=None)
+    arg_parser.add_argument("--hyperperiods", type=int, default=3)
+    arg_parser.add_argument("--max-tasks", type=int, default=6)
+    args = arg_parser.parse_args(argv)
+
+    discrepancies = run(args.count, args.seed, args.workers, args.hyperperiods, args.max_tasks)
+    for discrepancy in discrepancies:
+        print(f"--- case {discrepancy.case} (seed {args.seed}), shrunk to ---")
+        print(discrepancy.task_set[["task_id", "C_i", "T_i", "D_i"]].to_string(index=False))
+        for message in discrepancy.messages:
+            print(f"  {message}")
+    print(f"{args.count} task sets, {len(discrepancies)} discrepancies")
+    return 1 if discrepancies else 0
+
+
+def _check_chunk(args: Tuple[int, range, int, int]) -> List[int]:
+    seed, cases, amountOfHyperPeriods, max_tasks = args
+    return [case for case in cases if check_task_set(random_task_set(_rng(seed, case), max_tasks), amountOfHyperPeriods)]
+
+
+def _rng(seed: int, case: int) -> np.random.Generator:
+    return np.random.default_rng([seed, case])
+
+
+def _task_set(C, T, D) -> pd.DataFrame:
+    C = np.asarray(C, dtype=int)
+    return pd.DataFrame({
+        "task_id": np.arange(1, len(C) + 1),
+        "C_i_min": C,
+        "C_i": C,
+        "T_i": np.asarray(T, dtype=int),
+        "D_i": np.asarray(D, dtype=int),
+    })
+
+
+def _simplifications(task_set: pd.DataFrame):
+    C, T, D = (task_set[column].to_numpy() for column in ["C_i", "T_i", "D_i"])
+    n = len(C)
+    if n > 1:
+        for i in range(n):
+            keep = np.arange(n) != i
+            yield _task_set(C[keep], T[keep], D[keep])
+    for i in range(n):
+        index = np.arange(n) == i
+        for smaller in sorted({C[i] // 2, C[i] - 1}):
+            if smaller >= 1:
+                yield _task_set(np.where(index, smaller, C), T, D)
+        if D[i] < T[i]:
+            yield _task_set(C, T, np.where(index, T[i], D))
+        for period in (p for p in PERIODS if p < T[i]):
+            yield _task_set(np.where(index, min(C[i], period), C), np.where(index, period, T), np.where(index, min(D[i], period), D))
+
+
+def _schedule(metrics: TaskSetMetrics, task_set: pd.DataFrame) -> Schedule:
+    schedule: Schedule = {task_id: [] for task_id in task_set["task_id"]}
+    for task_id, activations in metrics.job_activation_times_by_task.items():
+        finishes = dict(metrics.job_completion_times_by_task[task_id])
+        schedule[task_id] = sorted((int(a), int(finishes[job_id])) for job_id, a in activations)
+    return schedule
+
+
+def _wcrt(metrics: TaskSetMetrics) -> Dict[Any, int]:
+    return {task_id: max(r for _, r in responses) for task_id, responses in metrics.job_response_times_by_task.items()}
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,60 @@
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Optional, Tuple
+
+# Modules started by short CLI runs and by worker processes, cheapest first.
+MODULES = [
+    "src.simulatorTool.simulator",
+    "src.simulatorTool.rate_monotonic",
+    "src.simulatorTool.earliest_deadline_first",
+    "src.misc.parser",
+    "src.misc.result_cache",
+    "src.pipeline",
+    "src.main",
+    "src.analysisTool.response_time_analysis_RM",
+    "src.server",
+]
+
+HEAVY_DEPENDENCIES = ("numpy", "pandas", "matplotlib", "pyarrow")
+
+_PROJECT_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+_CHILD = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def measure(module: str, repeat: int = 5) -> Tuple[float, List[str]]:
+    """Best import time of `module` in a fresh interpreter and the heavy dependencies it loaded."""
+    best = float("inf")
+    heavy: List[str] = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _CHILD.format(module=module, heavy=HEAVY_DEPENDENCIES)],
+            cwd=_PROJECT_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.splitlines()
+        best = min(best, float(output[0]))
+        heavy = [name for name in output[1].split(",") if name]
+    return best, heavy
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    arg_parser = argparse.ArgumentParser(description="Import time of the entry points, each in a fresh interpreter")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="runs per module, the best is reported")
+    arg_parser.add_argument("modules", nargs="*", default=MODULES)
+    args = arg_parser.parse_args(argv)
+
+    print(f"{'module':45} {'best ms':>8}  heavy dependencies loaded")
+    for module in args.modules:
+        seconds, heavy = measure(module, args.repeat)
+        print(f"{module:45} {seconds * 1000:8.1f}  {', '.join(heavy) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,38 @@
-from src.simulatorTool.simulator import Simulator, TaskSetMetrics
-from src.analysisTool.response_time_analysis_RM import response_time_analysis_rta
-from src.analysisTool.response_time_analysis_RM import analyze_taskset, print_analysis_summary
+from __future__ import annotations
 from src.misc.parser import Parser
+from src.misc.result_cache import ResultCache
+from src.misc.exporter import ColumnarExporter
+from src.telemetry import TelemetryMonitor
+from src.sharding import parse_shard, select_shard, summarize, merge_results, ShardResultWriter, WorkQueue
 from src.simulatorTool.earliest_deadline_first import EDF
 from src.simulatorTool.rate_monotonic import RateMonotonic
-import numpy as np
-import pandas as pd
-from typing import Optional, Dict
-import src.misc.plotting as plotting
-sim = Simulator()
-parser = Parser()
+from typing import TYPE_CHECKING, Optional
+import argparse
+import os
+
+# pandas, numpy and matplotlib are imported by the functions that need them,
+# so "--help", "--merge" and spawned worker processes start fast.
+if TYPE_CHECKING:
+    import pandas as pd
+    from src.analysisTool.sensitivity_analysis import SensitivityResult
+    from src.pipeline import PipelineResult
 
 
 
 #touch: simulation panel
 wcet = False
 isOnlyUnschedulableTestCases = True
+seed = 42
+useCache = True
+exportPath = None # directory for Parquet job/task tables, None to disable
+exportFormat = "parquet" # or "arrow"
+checkpointDir = None # directory for resumable checkpoints of running simulations, None to disable
+checkpointEvery = 10 # hyperperiods between checkpoints
+steadyState = True # WCET runs: extrapolate once the schedule repeats instead of simulating every hyperperiod
+resultsDir = "shard_results" # per-shard result files of --shard / --work-dir runs, read by --merge
+progressInterval = 10 # seconds between progress lines (progress, jobs/s, ETA, memory) of running simulations, None to disable
+telemetryPath = None # JSON-lines file for the progress samples of every simulation, None to disable
+mixedCriticality = False # switch to HI mode on LO budget overruns of HI tasks and drop LO tasks (Criticality/WCET_HI columns)
 
 if isOnlyUnschedulableTestCases:
     amountOfHyperPeriods = 100
@@ -28,10 +45,15 @@ algorithms = [RateMonotonic(), EDF()]
 path_to_all_tests = "test_examples"
 path_to_unschedulable = "test_examples/not_schedulable"
 
+def _set_pandas_display_options() -> None:
+    import pandas as pd
+    pd.set_option("display.max_colwidth", None)
 def display_rta_results(dfs: list[pd.DataFrame]) -> None:
     """
     Made with AI
     """
+    from src.analysisTool.response_time_analysis_RM import response_time_analysis_rta
+    _set_pandas_display_options()
 
     for idx, df in enumerate(dfs, start=1):
         print("\n" + "=" * 60)
@@ -55,45 +77,169 @@ def display_rta_results(dfs: list[pd.DataFrame]) -> None:
         print("\nSummary:")
         print(f"- Tasks: {len(results)}")
         print(f"- Deadline misses: {(~results['meets_deadline']).sum()}")
-def run_simulation_for_each_algorithm(dfs, algorithms) -> Dict[str, list[TaskSetMetrics]]:
-    results = {}
-    for algorithm in algorithms:
-        for df in dfs:
-            result = sim.start(df, algorithm, wcet, amountOfHyperPeriods)
-            results.setdefault(df["csv_id"][0], []).append((result))
-    return results
+def display_amc_results(dfs: list[pd.DataFrame]) -> None:
+    from src.analysisTool.amc_analysis_MC import amc_rtb_analysis, amc_max_analysis
+    _set_pandas_display_options()
+    for df in dfs:
+        print("\n" + "=" * 60)
+        print(f" {df['csv_id'].iloc[0]}")
+        print("=" * 60)
+        rtb_schedulable, _ = amc_rtb_analysis(df)
+        max_schedulable, results = amc_max_analysis(df)
+        print(f"AMC-rtb: {'SCHEDULABLE' if rtb_schedulable else 'NOT SCHEDULABLE'}")
+        print(f"AMC-max: {'SCHEDULABLE' if max_schedulable else 'NOT SCHEDULABLE'}\n")
+        columns = ["task_id", "C_i", "T_i", "D_i", "R_i_LO", "R_i_HI", "meets_deadline"]
+        if "criticality" in results:
+            columns[1:2] = ["criticality", "C_i", "C_i_HI"]
+        print(results[columns].to_string(index=False))
+def display_sensitivity_results(results: list[SensitivityResult]) -> None:
+    _set_pandas_display_options()
+    for result in results:
+        print("\n" + "=" * 60)
+        print(f" {result.task_set_name}")
+        print("=" * 60)
+        print(f"Utilization: {result.util:.3f}")
+        print(f"RM  (RTA):    C scaling factor {result.rm_scaling_factor:.4f}, breakdown utilization {result.rm_breakdown_utilization:.4f}")
+        print(f"EDF (demand): C scaling factor {result.edf_scaling_factor:.4f}, breakdown utilization {result.edf_breakdown_utilization:.4f}")
+        print("\nMax WCET per task (others unchanged, -1 = never schedulable):")
+        print(result.max_wcet_by_task.to_string(index=False))
 def analysis():
-    dfs = parser.load_all_csvs_recursive(path_to_all_tests)
+    dfs = Parser().load_all_csvs_recursive(path_to_all_tests)
     display_rta_results(dfs)
-def simulation():
+def mixed_criticality_analysis():
+    dfs = Parser().load_all_csvs_recursive(path_to_all_tests)
+    display_amc_results(dfs)
+def sensitivity():
+    from src.analysisTool.sensitivity_analysis import analyze_corpus_sensitivity
+    dfs = Parser().load_all_csvs_recursive(path_to_all_tests)
+    display_sensitivity_results(analyze_corpus_sensitivity(dfs))
+def print_summary(summary: dict) -> None:
+        print(f"--- Metrics per algorithm  ---")
+        print(f"Algorithm: {summary['algorithm']}")
+        print(f"Name: {summary['task_set']}")
+        print(f"Util: {summary['util']}")
+        print(f"Late tasks: {summary['num_late_tasks']}")
+        print(f"Theoretical schedud: {summary['is_schedulable_theoretical']}")
+        print(f"{summary['analysis']} scheduability: {summary['analysis_schedulable']}")
+        print(f"Simulator scheduability: {summary['is_scheduable_simulator']}")
+        if "mode_switches" in summary:
+            print(f"Mode switches: {summary['mode_switches']}")
+            print(f"LO jobs dropped: {summary['lo_service_degradation']:.1%}")
+        print("\n")
+def report_result(result: PipelineResult, exporter: Optional[ColumnarExporter] = None) -> None:
+        import src.misc.plotting as plotting
+        metrics = result.metrics
+        #Task set 
+        print_summary(summarize(result))
+
+        plotting.plot_wcrt_table(metrics, isOnlyUnschedulableTestCases)
+        if exporter is not None:
+            exporter.write(metrics)
+def simulation(shard: Optional[tuple] = None, work_dir: Optional[str] = None, stale_after: Optional[float] = None):
     
         if isOnlyUnschedulableTestCases:
-             dfs = parser.load_all_csvs_recursive(path_to_unschedulable)
+             path = path_to_unschedulable
         else:
-            dfs = parser.load_all_csvs_recursive(path_to_all_tests)
-
-        print("Running simulations - this take 1 min ish")
-        results = run_simulation_for_each_algorithm(dfs, algorithms)
-
-        for task_set, results_for_each_algorithm in results.items():
-            for result_for_algorithm in results_for_each_algorithm:
-                #Task set 
-                print(f"--- Metrics per algorithm  ---")
-                print(f"Algorithm: {result_for_algorithm.algorithm}")
-                print(f"Name: {result_for_algorithm.task_set['csv_id'][0]}")
-                print(f"Util: {result_for_algorithm.util}")
-                print(f"Late tasks: {result_for_algorithm.num_late_tasks}")
-                print(f"Theoretical schedud: {result_for_algorithm.is_schedulable_theoretical}")
-                print(f"Simulator scheduability: {result_for_algorithm.is_scheduable_simulator}")
-                print("\n")
-                
-        
-                plotting.plot_wcrt_table(result_for_algorithm, isOnlyUnschedulableTestCases)
+            path = path_to_all_tests
+
+        from src.pipeline import SimulationPipeline
+        print("Running simulations - results are printed as each task set finishes")
+        exporter = ColumnarExporter(exportPath, exportFormat) if exportPath else None
+        telemetry = None
+        if progressInterval or telemetryPath:
+            telemetry = TelemetryMonitor(progressInterval or None, telemetryPath)
+        pipeline = SimulationPipeline(algorithms, wcet, amountOfHyperPeriods, seed, ResultCache() if useCache else None,
+                                      checkpoint_dir=checkpointDir, checkpoint_every=checkpointEvery, steady_state=steadyState,
+                                      mixed_criticality=mixedCriticality, telemetry=telemetry)
+        csv_paths = Parser().find_csvs_recursive(path)
+        writer = None
+        queue = None
+        reported_by_task_set = {}
+        if shard is not None:
+            csv_paths = select_shard(csv_paths, *shard)
+            writer = ShardResultWriter(os.path.join(resultsDir, f"shard-{shard[0]}-of-{shard[1]}.jsonl"))
+        elif work_dir is not None:
+            queue = WorkQueue(work_dir, stale_after)
+            csv_paths = queue.claim_all(csv_paths)
+            writer = ShardResultWriter(os.path.join(resultsDir, f"worker-{queue.worker_id}.jsonl"))
+
+        def report(result: PipelineResult) -> None:
+            report_result(result, exporter)
+            if writer is not None:
+                writer.write(summarize(result))
+            if queue is not None:
+                name = result.metrics.task_set_name
+                reported_by_task_set[name] = reported_by_task_set.get(name, 0) + 1
+                if reported_by_task_set[name] == len(algorithms):
+                    queue.complete(name)
+
+        if telemetry is not None:
+            telemetry.start()
+        try:
+            pipeline.run_paths(csv_paths, report)
+        finally:
+            if telemetry is not None:
+                telemetry.close()
+            if exporter is not None:
+                exporter.close()
+            if writer is not None:
+                writer.close()
+def merge(results_dir: str) -> None:
+        for summary in merge_results(results_dir):
+            print_summary(summary)
      
-def main():
+def main(argv: Optional[list[str]] = None):
+        global useCache, exportPath, exportFormat, checkpointDir, steadyState, resultsDir, mixedCriticality, progressInterval, telemetryPath
+        arg_parser = argparse.ArgumentParser(description="Task set analysis and simulation tool")
+        arg_parser.add_argument("--no-cache", action="store_true", help="always re-simulate, ignore cached results")
+        arg_parser.add_argument("--export", metavar="DIR", help="write per-job and per-task results as columnar files to DIR")
+        arg_parser.add_argument("--export-format", choices=["parquet", "arrow"], default=exportFormat)
+        arg_parser.add_argument("--checkpoint-dir", metavar="DIR", help="checkpoint long simulations to DIR and resume interrupted ones")
+        arg_parser.add_argument("--no-steady-state", action="store_true", help="simulate every hyperperiod, even once the schedule repeats")
+        arg_parser.add_argument("--mixed-criticality", action="store_true", help="simulate mode switches of mixed-criticality task sets")
+        arg_parser.add_argument("--progress-interval", metavar="SECONDS", type=float, default=progressInterval,
+                                help="print the progress of running simulations every SECONDS, 0 to disable")
+        arg_parser.add_argument("--telemetry", metavar="FILE", help="append progress and memory samples of the simulations to FILE as JSON lines")
+        arg_parser.add_argument("--serve", action="store_true", help="run the HTTP/JSON analysis server instead of the menu")
+        arg_parser.add_argument("--port", type=int, default=8765, help="port of the analysis server")
+        arg_parser.add_argument("--shard", metavar="i/N", type=parse_shard, help="simulate only shard i (0-based) of N and exit")
+        arg_parser.add_argument("--work-dir", metavar="DIR", help="claim task sets through lock files in a shared DIR, simulate them and exit")
+        arg_parser.add_argument("--stale-after", metavar="SECONDS", type=float,
+                                help="with --work-dir, take over task sets claimed more than SECONDS ago and never finished")
+        arg_parser.add_argument("--results-dir", metavar="DIR", default=resultsDir, help="where --shard and --work-dir write their result files")
+        arg_parser.add_argument("--merge", metavar="DIR", help="print the combined summary of the shard result files in DIR and exit")
+        args = arg_parser.parse_args(argv)
+        resultsDir = args.results_dir
+        if args.no_cache:
+            useCache = False
+        if args.export:
+            exportPath = args.export
+        exportFormat = args.export_format
+        if args.checkpoint_dir:
+            checkpointDir = args.checkpoint_dir
+        if args.no_steady_state:
+            steadyState = False
+        if args.mixed_criticality:
+            mixedCriticality = True
+        progressInterval = args.progress_interval
+        if args.telemetry:
+            telemetryPath = args.telemetry
+        if args.serve:
+            from src.server import serve
+            serve(port=args.port, corpus_path=path_to_all_tests, use_cache=useCache)
+            return
+        if args.merge:
+            merge(args.merge)
+            return
+        if args.shard or args.work_dir:
+            simulation(shard=args.shard, work_dir=args.work_dir, stale_after=args.stale_after)
+            return
+
         while True:
             print("Press 1 to run analysis tool")
             print("Press 2 to run simulation tool")
+            print("Press 3 to run sensitivity analysis (breakdown utilization, max WCET per task)")
+            print("Press 4 to run mixed-criticality analysis (AMC-rtb, AMC-max)")
             print("Press anything else to quit")
             answer = input()
             if answer == "1":
@@ -101,7 +247,9 @@ def main():
             elif answer == "2": 
                 simulation()
             elif answer == "3":
-                 break
+                 sensitivity()
+            elif answer == "4":
+                 mixed_criticality_analysis()
             else:
                 break
             print("\n \n")
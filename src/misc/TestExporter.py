@@ -0,0 +1,79 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from src.misc.exporter import ARROW, PARQUET, ColumnarExporter
+from src.simulatorTool.simulator import Simulator
+from src.simulatorTool.earliest_deadline_first import EDF
+from src.simulatorTool.rate_monotonic import RateMonotonic
+from src.simulatorTool.task_set import TaskSet
+
+
+@unittest.skipUnless(importlib.util.find_spec("pyarrow"), "columnar export needs pyarrow")
+class TestExporter(unittest.TestCase):
+
+    def setUp(self):
+        # U = 1: RM misses deadlines of B, EDF does not
+        task_set = TaskSet.from_arrays(C=[2, 3], T=[4, 6], ids=["A", "B"], name="small.csv")
+        self.results = [Simulator().start(task_set, scheduler, True, 2) for scheduler in (RateMonotonic(), EDF())]
+
+    @staticmethod
+    def read(path, file_format):
+        import pyarrow.ipc
+        import pyarrow.parquet
+        if file_format == PARQUET:
+            return pyarrow.parquet.read_table(path)
+        with pyarrow.ipc.open_file(path) as reader:
+            return reader.read_all()
+
+    def test_round_trip(self):
+        import pyarrow as pa
+        import pyarrow.parquet
+
+        jobs_per_task = {(result.algorithm, task_id): [response for _, response in responses]
+                         for result in self.results for task_id, responses in result.job_response_times_by_task.items()}
+
+        for file_format in (PARQUET, ARROW):
+            with self.subTest(file_format=file_format):
+                output_dir = tempfile.mkdtemp()
+                with ColumnarExporter(output_dir, file_format, row_group_size=4) as exporter:
+                    for result in self.results:
+                        exporter.write(result)
+
+                jobs = self.read(os.path.join(output_dir, f"jobs.{file_format}"), file_format)
+                summary = self.read(os.path.join(output_dir, f"task_summary.{file_format}"), file_format)
+
+                self.assertEqual(jobs.num_rows, sum(len(responses) for responses in jobs_per_task.values()))
+                self.assertEqual(summary.num_rows, 4)
+                self.assertEqual(jobs.schema.names, ["task_set", "algorithm", "task_index", "task_id", "activation",
+                                                     "release", "finish", "response", "lateness"])
+                self.assertEqual(jobs.schema.field("task_index").type, pa.int32())
+                for column in ["activation", "release", "finish", "response", "lateness"]:
+                    self.assertEqual(jobs.schema.field(column).type, pa.int64(), column)
+                for column in ["task_set", "algorithm", "task_id"]:
+                    self.assertEqual(jobs.schema.field(column).type, pa.string(), column)
+                self.assertEqual(summary.schema, exporter.summary_schema)
+                self.assertEqual(summary.schema.field("avg_response").type, pa.float64())
+
+                job_rows = jobs.to_pylist()
+                self.assertEqual({row["task_set"] for row in job_rows}, {"small.csv"})
+                self.assertTrue(all(row["response"] == row["finish"] - row["activation"] for row in job_rows))
+
+                rows = summary.to_pylist()
+                self.assertEqual([(row["algorithm"], row["task_index"], row["task_id"]) for row in rows],
+                                 [(algorithm, index, task_id) for algorithm in ("RateMonotonic", "EDF")
+                                  for index, task_id in enumerate(["A", "B"])])
+                for row in rows:
+                    responses = jobs_per_task[(row["algorithm"], row["task_id"])]
+                    self.assertEqual((row["jobs"], row["wcrt"]), (len(responses), max(responses)))
+                    self.assertEqual((row["C_i"], row["T_i"], row["D_i"]), {"A": (2, 4, 4), "B": (3, 6, 6)}[row["task_id"]])
+                self.assertEqual({row["algorithm"] for row in rows if row["deadline_misses"]}, {"RateMonotonic"})
+
+                if file_format == PARQUET:
+                    metadata = pyarrow.parquet.ParquetFile(os.path.join(output_dir, "jobs.parquet")).metadata
+                    self.assertGreater(metadata.num_row_groups, 1)
+                    self.assertTrue(all(metadata.row_group(i).num_rows <= 4 for i in range(metadata.num_row_groups)))
+
+
+if __name__ == "__main__":
+    unittest.main()
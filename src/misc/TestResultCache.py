@@ -0,0 +1,78 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest import mock
+from src.misc import result_cache
+from src.misc.result_cache import ResultCache
+from src.simulatorTool.simulator import Simulator
+from src.simulatorTool.earliest_deadline_first import EDF
+from src.simulatorTool.rate_monotonic import RateMonotonic
+from src.simulatorTool.task_set import TaskSet
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "results.sqlite")
+        self.task_set = TaskSet.from_arrays(C=[1, 2], T=[4, 6], C_min=[0, 1], name="small.csv")
+
+    def keys_in_cache(self):
+        with sqlite3.connect(self.path) as conn:
+            return {key for key, in conn.execute("SELECT key FROM results")}
+
+    def test_hits_and_misses(self):
+        cache = ResultCache(self.path)
+        first = cache.run(Simulator(), self.task_set, RateMonotonic(), False, 2, seed=3)
+        second = cache.run(Simulator(), self.task_set, RateMonotonic(), False, 2, seed=3)
+
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(second.job_response_times_by_task, first.job_response_times_by_task)
+        self.assertIs(second.task_set, self.task_set)
+
+        cache.run(Simulator(), self.task_set, RateMonotonic(), False, 2, seed=4)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        # a new instance on the same file sees the stored results
+        reopened = ResultCache(self.path)
+        reopened.run(Simulator(), self.task_set, RateMonotonic(), False, 2, seed=4)
+        self.assertEqual((reopened.hits, reopened.misses), (1, 0))
+
+    def test_evicts_least_recently_used_over_byte_budget(self):
+        metrics = Simulator().start(self.task_set, RateMonotonic(), True, 1)
+        probe = ResultCache(self.path)
+        probe.put("probe", metrics)
+        with sqlite3.connect(self.path) as conn:
+            size, = conn.execute("SELECT size FROM results").fetchone()
+        probe.clear()
+
+        cache = ResultCache(self.path, max_bytes=int(2.5 * size))
+        for key in ["a", "b"]:
+            cache.put(key, metrics)
+            time.sleep(0.01)
+        self.assertIsNotNone(cache.get("a", self.task_set))
+        time.sleep(0.01)
+        cache.put("c", metrics)
+
+        self.assertEqual(self.keys_in_cache(), {"a", "c"})
+
+        cache = ResultCache(self.path, max_entries=1)
+        cache.put("d", metrics)
+        self.assertEqual(self.keys_in_cache(), {"d"})
+
+    def test_key_depends_on_every_input(self):
+        base = dict(task_set=self.task_set, scheduler=RateMonotonic(), wcet=False, amountOfHyperPeriods=2, seed=42,
+                    mixed_criticality=False)
+        key = ResultCache.make_key(**base)
+
+        self.assertEqual(ResultCache.make_key(**dict(base, task_set=self.task_set.take([0, 1]))), key)
+        for change in [dict(seed=43), dict(scheduler=EDF()), dict(wcet=True), dict(amountOfHyperPeriods=3),
+                       dict(mixed_criticality=True), dict(task_set=TaskSet.from_arrays(C=[1, 3], T=[4, 6], C_min=[0, 1]))]:
+            self.assertNotEqual(ResultCache.make_key(**dict(base, **change)), key, change)
+
+        with mock.patch.object(result_cache, "CACHE_VERSION", result_cache.CACHE_VERSION + 1):
+            self.assertNotEqual(ResultCache.make_key(**base), key)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+import os
+from typing import Any, Dict, List, Optional
+
+from src.simulatorTool.simulator import TaskSetMetrics
+
+PARQUET = "parquet"
+ARROW = "arrow"
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError("Columnar export needs pyarrow: pip install pyarrow") from error
+    return pyarrow
+
+
+class ColumnarExporter:
+    """Streams simulation results to typed Parquet or Arrow IPC files.
+
+    `jobs.<ext>` gets one row per completed job and is written in row groups
+    of at most `row_group_size` rows as results are added, so only one
+    result is held in memory at a time. `task_summary.<ext>` gets one row
+    per task, algorithm and task set and is written on `close()`.
+
+    Usage:
+        with ColumnarExporter("results") as exporter:
+            exporter.write(metrics)
+    """
+
+    def __init__(self, output_dir: str, file_format: str = PARQUET, row_group_size: int = 65_536) -> None:
+        if file_format not in (PARQUET, ARROW):
+            raise ValueError(f"Unknown export format '{file_format}', use '{PARQUET}' or '{ARROW}'")
+
+        self.pa = _import_pyarrow()
+        self.output_dir = output_dir
+        self.file_format = file_format
+        self.row_group_size = row_group_size
+
+        self.job_schema = self.pa.schema([
+            ("task_set", self.pa.string()),
+            ("algorithm", self.pa.string()),
+            ("task_index", self.pa.int32()),
+            ("task_id", self.pa.string()),
+            ("activation", self.pa.int64()),
+            ("release", self.pa.int64()),
+            ("finish", self.pa.int64()),
+            ("response", self.pa.int64()),
+            ("lateness", self.pa.int64()),
+        ])
+        self.summary_schema = self.pa.schema([
+            ("task_set", self.pa.string()),
+            ("algorithm", self.pa.string()),
+            ("task_index", self.pa.int32()),
+            ("task_id", self.pa.string()),
+            ("C_i", self.pa.int64()),
+            ("T_i", self.pa.int64()),
+            ("D_i", self.pa.int64()),
+            ("jobs", self.pa.int64()),
+            ("wcrt", self.pa.int64()),
+            ("avg_response", self.pa.float64()),
+            ("max_lateness", self.pa.int64()),
+            ("deadline_misses", self.pa.int64()),
+        ])
+
+        os.makedirs(output_dir, exist_ok=True)
+        self.jobs_path = os.path.join(output_dir, f"jobs.{file_format}")
+        self.summary_path = os.path.join(output_dir, f"task_summary.{file_format}")
+        self._job_writer = self._open_writer(self.jobs_path, self.job_schema)
+        self._summary_rows: List[Dict[str, Any]] = []
+
+    def write(self, metrics: TaskSetMetrics) -> None:
+        """Append the jobs and per-task summary of one simulation result."""
+        buffer = self._empty_job_columns()
+
+        for task_index, task_id in enumerate(self._task_ids(metrics)):
+            responses = metrics.job_response_times_by_task.get(task_id, [])
+            activations = metrics.job_activation_times_by_task.get(task_id, [])
+            releases = metrics.job_release_times_by_task.get(task_id, [])
+            completions = metrics.job_completion_times_by_task.get(task_id, [])
+            lateness = metrics.job_lateness_by_task.get(task_id, [])
+
+            for (_, response), (_, activation), (_, release), (_, finish), (_, late) in zip(
+                responses, activations, releases, completions, lateness
+            ):
+                buffer["task_index"].append(task_index)
+                buffer["task_id"].append(str(task_id))
+                buffer["activation"].append(int(activation))
+                buffer["release"].append(int(release))
+                buffer["finish"].append(int(finish))
+                buffer["response"].append(int(response))
+                buffer["lateness"].append(int(late))
+
+                if len(buffer["task_index"]) >= self.row_group_size:
+                    self._flush_jobs(buffer, metrics)
+                    buffer = self._empty_job_columns()
+
+            self._summary_rows.append(self._summarize_task(metrics, task_index, task_id, responses, lateness))
+
+        if buffer["task_index"]:
+            self._flush_jobs(buffer, metrics)
+
+    def close(self) -> None:
+        """Finish the jobs file and write the per-task summary table."""
+        if self._job_writer is None:
+            return
+        self._job_writer.close()
+        self._job_writer = None
+
+        summary = self.pa.Table.from_pylist(self._summary_rows, schema=self.summary_schema)
+        writer = self._open_writer(self.summary_path, self.summary_schema)
+        writer.write_table(summary)
+        writer.close()
+
+    def __enter__(self) -> "ColumnarExporter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _flush_jobs(self, buffer: Dict[str, List], metrics: TaskSetMetrics) -> None:
+        n = len(buffer["task_index"])
+        # Task set and algorithm are constant per result; Parquet dictionary-encodes them on disk.
+        arrays = {
+            "task_set": self.pa.repeat(metrics.task_set_name, n),
+            "algorithm": self.pa.repeat(metrics.algorithm, n),
+        }
+        for name, values in buffer.items():
+            arrays[name] = self.pa.array(values, type=self.job_schema.field(name).type)
+
+        batch = self.pa.RecordBatch.from_arrays(
+            [arrays[field.name] for field in self.job_schema], schema=self.job_schema
+        )
+        if self.file_format == PARQUET:
+            self._job_writer.write_batch(batch, row_group_size=n)
+        else:
+            self._job_writer.write_batch(batch)
+
+    def _summarize_task(self, metrics: TaskSetMetrics, task_index: int, task_id: Any,
+                        responses: List, lateness: List) -> Dict[str, Any]:
+        row = self._task_row(metrics, task_id)
+        response_values = [r for _, r in responses if r is not None]
+        lateness_values = [late for _, late in lateness if late is not None]
+        return {
+            "task_set": metrics.task_set_name,
+            "algorithm": metrics.algorithm,
+            "task_index": task_index,
+            "task_id": str(task_id),
+            "C_i": self._optional_int(row, "C_i"),
+            "T_i": self._optional_int(row, "T_i"),
+            "D_i": self._optional_int(row, "D_i"),
+            "jobs": len(response_values),
+            "wcrt": int(max(response_values)) if response_values else None,
+            "avg_response": sum(response_values) / len(response_values) if response_values else None,
+            "max_lateness": int(max(lateness_values)) if lateness_values else None,
+            "deadline_misses": sum(1 for late in lateness_values if late > 0),
+        }
+
+    def _open_writer(self, path: str, schema):
+        if self.file_format == PARQUET:
+            return self.pa.parquet.ParquetWriter(path, schema)
+        return self.pa.ipc.new_file(path, schema)
+
+    @staticmethod
+    def _task_ids(metrics: TaskSetMetrics) -> List[Any]:
+        """Task ids in task set order, falling back to result order without a task set."""
+        if metrics.task_set is not None:
+            return metrics.task_set.ids.tolist()
+        return list(metrics.job_response_times_by_task.keys())
+
+    @staticmethod
+    def _task_row(metrics: TaskSetMetrics, task_id: Any) -> Optional[Dict[str, Any]]:
+        if metrics.task_set is None:
+            return None
+        indices = (metrics.task_set.ids == task_id).nonzero()[0]
+        return metrics.task_set.task(int(indices[0])) if len(indices) else None
+
+    @staticmethod
+    def _optional_int(row: Optional[Dict[str, Any]], column: str) -> Optional[int]:
+        if row is None or column not in row:
+            return None
+        return int(row[column])
+
+    @staticmethod
+    def _empty_job_columns() -> Dict[str, List]:
+        return {name: [] for name in ("task_index", "task_id", "activation", "release", "finish", "response", "lateness")}
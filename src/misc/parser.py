@@ -1,8 +1,11 @@
-import pandas as pd
+from __future__ import annotations
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import os
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class Parser:
 
@@ -16,9 +19,13 @@ class Parser:
         project_root = os.path.normpath(os.path.join(script_dir, ".."))
         abs_path = os.path.normpath(os.path.join(project_root, rel_path))
 
+        import pandas as pd
+
         df = pd.read_csv(abs_path)
 
-        # normalize headers (BCET/WCET/Period/Deadline -> C_i_min/C_i/T_i/D_i)
+        # normalize headers (BCET/WCET/Period/Deadline -> C_i_min/C_i/T_i/D_i,
+        # optional Offset/Jitter/Slack/Release -> O_i/J_i/S_i/release,
+        # mixed criticality Criticality/WCET_LO/WCET_HI -> criticality/C_i/C_i_HI)
         self._rename_headers(df)
 
         if "csv_id" not in df.columns:
@@ -27,32 +34,63 @@ class Parser:
         return df
         
     def load_all_csvs_recursive(self, path: str) -> list[pd.DataFrame]:
-            import os
-            csvs = []
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.normpath(os.path.join(script_dir, ".."))
-            search_dir = os.path.normpath(os.path.join(project_root, path))
-            for root, dirs, files in os.walk(search_dir):
-                for file_name in files:
-                    csv_path = os.path.join(root, file_name)
-                    csvs.append(csv_path)
-
-            dfs = []
-            for csv in csvs:
-                df = pd.read_csv(csv)
-                self._rename_headers(df)
-                p = Path(csv)
-                last = Path(*p.parts[-1:])
-                df["csv_id"] = str(last)
-                dfs.append(df)
-            return dfs
+        return [self.load_csv(csv) for csv in self.find_csvs_recursive(path)]
+
+    def find_csvs_recursive(self, path: str) -> list[str]:
+        """Absolute paths of all files below `path` (relative to the project root)."""
+        csvs = []
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        project_root = os.path.normpath(os.path.join(script_dir, ".."))
+        search_dir = os.path.normpath(os.path.join(project_root, path))
+        for root, dirs, files in os.walk(search_dir):
+            for file_name in files:
+                csv_path = os.path.join(root, file_name)
+                csvs.append(csv_path)
+        return csvs
+
+    def load_csv(self, csv_path: str) -> pd.DataFrame:
+        """Load one taskset CSV given an absolute path, csv_id is the file name."""
+        import pandas as pd
+
+        df = pd.read_csv(csv_path)
+        self._rename_headers(df)
+        p = Path(csv_path)
+        last = Path(*p.parts[-1:])
+        df["csv_id"] = str(last)
+        return df
+
+    def load_records(self, records: list[dict], csv_id: str = "request") -> pd.DataFrame:
+        """Build a taskset from a list of task dicts, with CSV headers (BCET, WCET, ...) or internal names (C_i, ...)."""
+        if not records:
+            raise ValueError("Taskset has no tasks")
+        import pandas as pd
+
+        df = pd.DataFrame.from_records(records)
+        if "task_id" in df.columns:
+            task_ids = df.pop("task_id")
+            self._rename_headers(df)
+            df["task_id"] = task_ids
+        else:
+            self._rename_headers(df)
+        df["csv_id"] = csv_id
+        return df
 
     def _rename_headers(self, df:pd.DataFrame):
+        # WCET_LO is the WCET of a mixed-criticality task set, only one of them may be given
+        if 'WCET_LO' in df.columns and 'WCET' in df.columns:
+            raise ValueError("Taskset has both WCET and WCET_LO columns")
         df.rename(columns={
             'BCET': 'C_i_min',
             'WCET': 'C_i',
             'Period': 'T_i',
             'Deadline': 'D_i',
+            'Offset': 'O_i',
+            'Jitter': 'J_i',
+            'Slack': 'S_i',
+            'Release': 'release',
+            'Criticality': 'criticality',
+            'WCET_LO': 'C_i',
+            'WCET_HI': 'C_i_HI',
         }, inplace=True)
 
         df.insert(0, 'task_id', range(1, len(df) + 1))
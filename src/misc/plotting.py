@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 from typing import List, Tuple
 from src.simulatorTool.simulator import TaskSetMetrics
 
@@ -22,6 +21,8 @@ def _count_deadline_misses(values: List[Tuple[str, float]]) -> int:
 
 
 def plot_all_task_metrics(metrics: TaskSetMetrics) -> None:
+    # interactive (plt.show), so pyplot is only imported here
+    import matplotlib.pyplot as plt
 
     task_ids = list(metrics.job_response_times_by_task.keys())
     n_tasks = len(task_ids)
@@ -29,10 +30,7 @@ def plot_all_task_metrics(metrics: TaskSetMetrics) -> None:
     x_positions = list(range(1, n_tasks + 1))
 
     # 🔹 Map task_id -> period
-    task_periods = {
-        row["task_id"]: row["T_i"]
-        for _, row in metrics.task_set.iterrows()
-    }
+    task_periods = dict(zip(metrics.task_set.ids.tolist(), metrics.task_set.T.tolist()))
 
     avg_response = [
         _extract_avg(metrics.job_response_times_by_task[t])
@@ -119,19 +117,15 @@ def plot_all_task_metrics(metrics: TaskSetMetrics) -> None:
     plt.show()
 
 
-    import matplotlib.pyplot as plt
-
 import os
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
 def plot_wcrt_table(metrics, isOnlyUnschedulableTestCases):
+    # a bare Figure renders with Agg and keeps no pyplot state, so this is safe outside the main thread
 
     task_ids = list(metrics.job_response_times_by_task.keys())
 
-    task_periods = {
-        row["task_id"]: row["T_i"]
-        for _, row in metrics.task_set.iterrows()
-    }
+    task_periods = dict(zip(metrics.task_set.ids.tolist(), metrics.task_set.T.tolist()))
 
     table_data = []
 
@@ -147,7 +141,8 @@ def plot_wcrt_table(metrics, isOnlyUnschedulableTestCases):
 
     columns = ["Task", "WCRT", "Period", "R / T"]
 
-    fig, ax = plt.subplots(figsize=(8, len(task_ids) * 0.5 + 1))
+    fig = Figure(figsize=(8, len(task_ids) * 0.5 + 1))
+    ax = fig.subplots()
     ax.axis("off")
 
     table = ax.table(
@@ -160,7 +155,7 @@ def plot_wcrt_table(metrics, isOnlyUnschedulableTestCases):
     table.set_fontsize(10)
     table.scale(1, 1.5)
 
-    plt.title(f"WCRT Table - {metrics.algorithm}", pad=10)
+    ax.set_title(f"WCRT Table - {metrics.algorithm}", pad=10)
 
    # ---- OUTPUT PATH ----
     base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -175,5 +170,4 @@ def plot_wcrt_table(metrics, isOnlyUnschedulableTestCases):
     filename = f"{metrics.task_set_name}_{metrics.algorithm}_table.png"
     full_path = os.path.join(output_dir, filename)
 
-    plt.savefig(full_path, bbox_inches="tight", dpi=300)
-    plt.close(fig)
+    fig.savefig(full_path, bbox_inches="tight", dpi=300)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+import dataclasses
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from src.simulatorTool.simulator import Simulator, TaskSetMetrics
+from src.simulatorTool.task_set import TaskSet, as_task_set
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Bump when the simulator changes in a way that changes results, so stale entries are ignored.
+CACHE_VERSION = 7
+
+DEFAULT_CACHE_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", ".cache", "simulation_results.sqlite")
+)
+
+
+class ResultCache:
+    """Persistent cache of simulation results, keyed by a hash of the run inputs.
+
+    A run is fully determined by the task set contents, the scheduler, the
+    execution time mode, the number of hyperperiods, the seed and whether
+    mixed criticality mode switches are simulated. The stored
+    value is the TaskSetMetrics without its task set, zlib-compressed.
+    Least recently used entries are evicted once `max_entries` or
+    `max_bytes` is exceeded.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = 10_000, max_bytes: int = 512 * 1024 * 1024) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " payload BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+
+    def run(self, sim: Simulator, task_set: Union[TaskSet, pd.DataFrame], scheduler: Any, wcet: bool,
+            amountOfHyperPeriods: int = 1, seed: int = 42, mixed_criticality: bool = False) -> TaskSetMetrics:
+        """Return the cached result of `sim.start(...)`, simulating and storing it on a miss."""
+        task_set = as_task_set(task_set)
+        key = self.make_key(task_set, scheduler, wcet, amountOfHyperPeriods, seed, mixed_criticality)
+        return self.get_or_compute(
+            key, task_set, lambda: sim.start(task_set, scheduler, wcet, amountOfHyperPeriods, seed,
+                                             mixed_criticality=mixed_criticality)
+        )
+
+    def get_or_compute(self, key: str, task_set: Union[TaskSet, pd.DataFrame], compute: Callable[[], TaskSetMetrics]) -> TaskSetMetrics:
+        result = self.get(key, task_set)
+        if result is None:
+            result = compute()
+            self.put(key, result)
+        return result
+
+    @staticmethod
+    def make_key(task_set: Union[TaskSet, pd.DataFrame], scheduler: Any, wcet: bool, amountOfHyperPeriods: int, seed: int,
+                 mixed_criticality: bool = False) -> str:
+        """Content hash of everything that determines a simulation run."""
+        digest = hashlib.sha256(as_task_set(task_set).content_key())
+        parts = [CACHE_VERSION, scheduler, bool(wcet), int(amountOfHyperPeriods), int(seed), bool(mixed_criticality)]
+        for part in parts:
+            digest.update(f"{part}\x00".encode())
+        return digest.hexdigest()
+
+    def get(self, key: str, task_set: Union[TaskSet, pd.DataFrame]) -> Optional[TaskSetMetrics]:
+        """Look up `key` and re-attach `task_set` to the stored metrics."""
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT payload FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE results SET last_access = ? WHERE key = ?", (time.time(), key))
+
+        self.hits += 1
+        fields = pickle.loads(zlib.decompress(row[0]))
+        return TaskSetMetrics(task_set=as_task_set(task_set), **fields)
+
+    def put(self, key: str, metrics: TaskSetMetrics) -> None:
+        """Store `metrics` (without the task set) and evict if over budget."""
+        fields = {
+            field.name: getattr(metrics, field.name)
+            for field in dataclasses.fields(metrics)
+            if field.name != "task_set"
+        }
+        payload = zlib.compress(pickle.dumps(fields, protocol=pickle.HIGHEST_PROTOCOL))
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, payload, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time()),
+            )
+            self._evict(conn)
+
+    def clear(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM results")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used entries until both budgets are met."""
+        count, total_size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        if count <= self.max_entries and total_size <= self.max_bytes:
+            return
+
+        to_delete = []
+        for key, size in conn.execute("SELECT key, size FROM results ORDER BY last_access ASC"):
+            if count <= self.max_entries and total_size <= self.max_bytes:
+                break
+            to_delete.append((key,))
+            count -= 1
+            total_size -= size
+        conn.executemany("DELETE FROM results WHERE key = ?", to_delete)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
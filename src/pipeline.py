@@ -0,0 +1,181 @@
+from __future__ import annotations
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Tuple, Union
+
+from src.misc.parser import Parser
+from src.misc.result_cache import ResultCache
+from src.simulatorTool.earliest_deadline_first import EDF
+from src.simulatorTool.simulator import Simulator, TaskSetMetrics
+from src.simulatorTool.task_set import TaskSet
+from src.telemetry import TelemetryMonitor, install_worker_telemetry, worker_sampler
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# end of stream marker passed between stages
+_DONE = None
+
+
+@dataclass(frozen=True)
+class PipelineResult:
+    metrics: TaskSetMetrics
+    # verdict of the exact test for the simulated algorithm, see `analyse_task_set`
+    analysis: str
+    analysis_schedulable: bool
+
+
+def analyse_task_set(task_set: TaskSet, algorithm: Any) -> Tuple[str, bool]:
+    """(name, verdict) of the exact schedulability test for `algorithm`: processor demand for EDF, else RTA."""
+    # numpy is only needed by the parent's screening stage, not by the simulation workers
+    if isinstance(algorithm, EDF):
+        from src.analysisTool.demand_analysis_EDF import demand_analysis_edf
+        return "Processor demand", bool(demand_analysis_edf(task_set))
+    from src.analysisTool.response_time_analysis_RM import response_times
+    return "RTA", bool(response_times(task_set)[1])
+
+
+def simulate_task_set(df: Union[TaskSet, pd.DataFrame], algorithm: Any, wcet: bool, amountOfHyperPeriods: int, seed: int,
+              cache: Optional[ResultCache], checkpoint_dir: Optional[str] = None, checkpoint_every: int = 10,
+              steady_state: bool = True, mixed_criticality: bool = False) -> TaskSetMetrics:
+    """Runs in a worker process.
+
+    With `checkpoint_dir` the run is checkpointed to a file named after its
+    cache key, and a checkpoint left behind by an interrupted run is resumed.
+    Progress is sampled if the worker was started with `install_worker_telemetry`.
+    """
+    key = ResultCache.make_key(df, algorithm, wcet, amountOfHyperPeriods, seed, mixed_criticality)
+
+    def simulate() -> TaskSetMetrics:
+        sim = Simulator()
+        telemetry = worker_sampler()
+        if checkpoint_dir is None:
+            return sim.start(df, algorithm, wcet, amountOfHyperPeriods, seed, steady_state=steady_state,
+                             mixed_criticality=mixed_criticality, telemetry=telemetry)
+
+        checkpoint_path = os.path.join(checkpoint_dir, f"{key}.ckpt")
+        if os.path.exists(checkpoint_path):
+            result = sim.resume(checkpoint_path, telemetry)
+        else:
+            result = sim.start(df, algorithm, wcet, amountOfHyperPeriods, seed, checkpoint_path=checkpoint_path,
+                               checkpoint_every=checkpoint_every, steady_state=steady_state,
+                               mixed_criticality=mixed_criticality, telemetry=telemetry)
+        Simulator.remove_checkpoint(checkpoint_path)
+        return result
+
+    if cache is not None:
+        return cache.get_or_compute(key, df, simulate)
+    return simulate()
+
+
+class SimulationPipeline:
+    """Streams task sets through load -> screening -> simulation -> report.
+
+    Screening runs the exact test of each algorithm (`analyse_task_set`).
+
+    Task sets travel as TaskSet arrays, so the simulation workers never
+    unpickle a DataFrame (or import pandas).
+
+    Stages are connected by bounded asyncio queues, so a slow stage makes
+    the earlier ones wait instead of piling up DataFrames or results. CSV
+    loading and screening run in a thread, simulations in `max_workers` processes,
+    and `report` is called from a single thread, off the event loop, as
+    soon as each result is done; its figures must not use pyplot, which is
+    not thread safe (see plotting.plot_wcrt_table). With a `telemetry` monitor the
+    workers send it progress samples of their running simulations.
+    """
+
+    def __init__(self, algorithms: list, wcet: bool, amountOfHyperPeriods: int, seed: int = 42,
+                 cache: Optional[ResultCache] = None, max_workers: Optional[int] = None, queue_size: int = 4,
+                 checkpoint_dir: Optional[str] = None, checkpoint_every: int = 10, steady_state: bool = True,
+                 mixed_criticality: bool = False, telemetry: Optional[TelemetryMonitor] = None) -> None:
+        self.algorithms = algorithms
+        self.wcet = wcet
+        self.amountOfHyperPeriods = amountOfHyperPeriods
+        self.seed = seed
+        self.cache = cache
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_every = checkpoint_every
+        self.steady_state = steady_state
+        self.mixed_criticality = mixed_criticality
+        self.telemetry = telemetry
+        self.parser = Parser()
+        if checkpoint_dir is not None:
+            os.makedirs(checkpoint_dir, exist_ok=True)
+
+    def run(self, path: str, report: Callable[[PipelineResult], None]) -> int:
+        """Process every CSV below `path`, returns the number of reported results."""
+        return self.run_paths(self.parser.find_csvs_recursive(path), report)
+
+    def run_paths(self, csv_paths: Iterable[str], report: Callable[[PipelineResult], None]) -> int:
+        """Process the given CSV files. `csv_paths` may be a lazy iterator, it is consumed as the load stage proceeds."""
+        return asyncio.run(self.run_async(csv_paths, report))
+
+    async def run_async(self, csv_paths: Iterable[str], report: Callable[[PipelineResult], None]) -> int:
+        loop = asyncio.get_running_loop()
+        screening_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        simulation_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        report_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+
+        n_simulators = self.max_workers or os.cpu_count() or 1
+        worker_setup = {}
+        if self.telemetry is not None:
+            worker_setup = dict(initializer=install_worker_telemetry,
+                                initargs=(self.telemetry.queue, self.telemetry.sample_interval))
+
+        with ThreadPoolExecutor(max_workers=1) as io_pool, \
+                ThreadPoolExecutor(max_workers=1) as report_pool, \
+                ProcessPoolExecutor(max_workers=n_simulators, **worker_setup) as sim_pool:
+
+            async def load() -> None:
+                for csv_path in csv_paths:
+                    task_set = await loop.run_in_executor(io_pool, self._load_task_set, csv_path)
+                    await screening_queue.put(task_set)
+                await screening_queue.put(_DONE)
+
+            async def screen() -> None:
+                while (task_set := await screening_queue.get()) is not _DONE:
+                    for algorithm in self.algorithms:
+                        analysis = await loop.run_in_executor(io_pool, analyse_task_set, task_set, algorithm)
+                        await simulation_queue.put((task_set, algorithm, analysis))
+                for _ in range(n_simulators):
+                    await simulation_queue.put(_DONE)
+
+            async def simulate() -> None:
+                while (item := await simulation_queue.get()) is not _DONE:
+                    task_set, algorithm, analysis = item
+                    metrics = await loop.run_in_executor(
+                        sim_pool, simulate_task_set, task_set, algorithm, self.wcet, self.amountOfHyperPeriods, self.seed, self.cache,
+                        self.checkpoint_dir, self.checkpoint_every, self.steady_state, self.mixed_criticality,
+                    )
+                    await report_queue.put(PipelineResult(metrics, *analysis))
+                await report_queue.put(_DONE)
+
+            async def write_reports() -> int:
+                reported = 0
+                running_simulators = n_simulators
+                while running_simulators:
+                    result = await report_queue.get()
+                    if result is _DONE:
+                        running_simulators -= 1
+                        continue
+                    await loop.run_in_executor(report_pool, report, result)
+                    reported += 1
+                return reported
+
+            tasks = [asyncio.ensure_future(stage) for stage in
+                     [load(), screen(), *(simulate() for _ in range(n_simulators)), write_reports()]]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+            return results[-1]
+
+    def _load_task_set(self, csv_path: str) -> TaskSet:
+        return TaskSet.from_dataframe(self.parser.load_csv(csv_path))
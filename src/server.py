@@ -0,0 +1,265 @@
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.analysisTool.demand_analysis_EDF import demand_analysis_edf
+from src.analysisTool.response_time_analysis_RM import response_time_analysis_rta
+from src.misc.parser import Parser
+from src.misc.result_cache import ResultCache
+from src.pipeline import simulate_task_set
+from src.simulatorTool.earliest_deadline_first import EDF
+from src.simulatorTool.rate_monotonic import RateMonotonic
+from src.simulatorTool.simulator import TaskSetMetrics
+
+
+class LatencyStats:
+    """Request count, errors and latency percentiles per endpoint (last `window` requests)."""
+
+    def __init__(self, window: int = 1000) -> None:
+        self.window = window
+        self.lock = threading.Lock()
+        self.latencies: Dict[str, deque] = {}
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, endpoint: str, seconds: float, failed: bool) -> None:
+        with self.lock:
+            self.latencies.setdefault(endpoint, deque(maxlen=self.window)).append(seconds)
+            self.counts[endpoint] = self.counts.get(endpoint, 0) + 1
+            if failed:
+                self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def summary(self) -> Dict[str, Any]:
+        with self.lock:
+            snapshot = {endpoint: list(values) for endpoint, values in self.latencies.items()}
+            counts, errors = dict(self.counts), dict(self.errors)
+
+        summary = {}
+        for endpoint, values in snapshot.items():
+            ms = np.array(values) * 1000
+            summary[endpoint] = {
+                "requests": counts[endpoint],
+                "errors": errors.get(endpoint, 0),
+                "mean_ms": round(float(ms.mean()), 3),
+                "p50_ms": round(float(np.percentile(ms, 50)), 3),
+                "p95_ms": round(float(np.percentile(ms, 95)), 3),
+                "max_ms": round(float(ms.max()), 3),
+            }
+        return summary
+
+
+class AnalysisService:
+    """Keeps the corpus, schedulers, caches and simulation workers warm between requests.
+
+    A request names a corpus task set ({"task_set": "<csv file name>"}) or
+    sends one ({"tasks": [{"WCET": 1, "Period": 4, "Deadline": 4}, ...]},
+    CSV headers or internal column names).
+    """
+
+    def __init__(self, corpus_path: Optional[str] = "test_examples", cache: Optional[ResultCache] = None,
+                 max_workers: Optional[int] = None, analysis_cache_size: int = 1024) -> None:
+        self.parser = Parser()
+        self.corpus: Dict[str, pd.DataFrame] = {}
+        if corpus_path is not None:
+            for df in self.parser.load_all_csvs_recursive(corpus_path):
+                self.corpus[df["csv_id"][0]] = df
+
+        self.schedulers = {"RM": RateMonotonic(), "RateMonotonic": RateMonotonic(), "EDF": EDF()}
+        self.cache = cache
+        self.workers = ProcessPoolExecutor(max_workers=max_workers)
+        self.analysis_cache: OrderedDict = OrderedDict()
+        self.analysis_cache_size = analysis_cache_size
+        self.analysis_cache_lock = threading.Lock()
+        self.stats = LatencyStats()
+
+    def close(self) -> None:
+        self.workers.shutdown(cancel_futures=True)
+
+    def list_corpus(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        return {"task_sets": sorted(self.corpus)}
+
+    def rta(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        df = self._task_set(body)
+        return self._cached("rta", df, lambda: self._rta_response(df))
+
+    def edf(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        df = self._task_set(body)
+        return self._cached("edf", df, lambda: {
+            "task_set": df["csv_id"][0],
+            "utilization": float((df["C_i"] / df["T_i"]).sum()),
+            "schedulable": bool(demand_analysis_edf(df)),
+        })
+
+    def simulate(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        df = self._task_set(body)
+        algorithm = body.get("algorithm", "RM")
+        if algorithm not in self.schedulers:
+            raise ValueError(f"Unknown algorithm '{algorithm}', use one of {sorted(self.schedulers)}")
+
+        run = (self.schedulers[algorithm], bool(body.get("wcet", True)), int(body.get("hyperperiods", 1)), int(body.get("seed", 42)))
+
+        def simulate() -> TaskSetMetrics:
+            return self.workers.submit(simulate_task_set, df, *run, None).result()
+
+        # the cache is used here, not in the worker, so its hit/miss counters in /metrics are this process's
+        if self.cache is None:
+            return self._simulation_response(simulate())
+        return self._simulation_response(self.cache.get_or_compute(ResultCache.make_key(df, *run), df, simulate))
+
+    def metrics(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        return {"endpoints": self.stats.summary(), "corpus_size": len(self.corpus),
+                "result_cache": {"hits": self.cache.hits, "misses": self.cache.misses} if self.cache else None}
+
+    def _task_set(self, body: Dict[str, Any]) -> pd.DataFrame:
+        if "task_set" in body:
+            name = body["task_set"]
+            if name not in self.corpus:
+                raise ValueError(f"Unknown task set '{name}'")
+            return self.corpus[name]
+        if "tasks" in body:
+            df = self.parser.load_records(body["tasks"], body.get("name", "request"))
+            missing = {"C_i", "T_i", "D_i"} - set(df.columns)
+            if missing:
+                raise ValueError(f"Taskset missing required columns: {sorted(missing)}")
+            return df
+        raise ValueError("Request needs 'task_set' (corpus name) or 'tasks'")
+
+    def _cached(self, kind: str, df: pd.DataFrame, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        key = (kind, df.to_csv(index=False))
+        with self.analysis_cache_lock:
+            if key in self.analysis_cache:
+                self.analysis_cache.move_to_end(key)
+                return self.analysis_cache[key]
+        response = compute()
+        with self.analysis_cache_lock:
+            self.analysis_cache[key] = response
+            if len(self.analysis_cache) > self.analysis_cache_size:
+                self.analysis_cache.popitem(last=False)
+        return response
+
+    @staticmethod
+    def _rta_response(df: pd.DataFrame) -> Dict[str, Any]:
+        schedulable, results = response_time_analysis_rta(df)
+        return {
+            "task_set": df["csv_id"][0],
+            "schedulable": bool(schedulable),
+            "tasks": [
+                {"task_id": _json_value(row["task_id"]), "C_i": _json_value(row["C_i"]), "T_i": _json_value(row["T_i"]),
+                 "D_i": _json_value(row["D_i"]), "R_i": float(row["R_i"]), "meets_deadline": bool(row["meets_deadline"])}
+                for _, row in results.iterrows()
+            ],
+        }
+
+    @staticmethod
+    def _simulation_response(metrics: TaskSetMetrics) -> Dict[str, Any]:
+        tasks = []
+        for task_id, responses in metrics.job_response_times_by_task.items():
+            values = [r for _, r in responses if r is not None]
+            lateness = [late for _, late in metrics.job_lateness_by_task.get(task_id, []) if late is not None]
+            tasks.append({
+                "task_id": _json_value(task_id),
+                "jobs": len(values),
+                "wcrt": _json_value(max(values)) if values else None,
+                "deadline_misses": sum(1 for late in lateness if late > 0),
+            })
+        return {
+            "task_set": metrics.task_set_name,
+            "algorithm": metrics.algorithm,
+            "util": metrics.util,
+            "is_schedulable_theoretical": bool(metrics.is_schedulable_theoretical),
+            "is_schedulable_simulator": bool(metrics.is_scheduable_simulator),
+            "num_late_tasks": metrics.num_late_tasks,
+            "average_response_time": metrics.average_response_time,
+            "simulated_hyperperiods": metrics.simulated_hyperperiods,
+            "tasks": tasks,
+        }
+
+
+def _json_value(value: Any) -> Any:
+    """numpy scalars -> plain Python for json."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    # set on the subclass created in make_server
+    service: AnalysisService
+    routes: Dict[tuple, str] = {
+        ("GET", "/corpus"): "list_corpus",
+        ("POST", "/rta"): "rta",
+        ("POST", "/edf"): "edf",
+        ("POST", "/simulate"): "simulate",
+        ("GET", "/metrics"): "metrics",
+    }
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def _handle(self, method: str) -> None:
+        start = time.perf_counter()
+        endpoint = self.path.split("?", 1)[0]
+        route = self.routes.get((method, endpoint))
+        status = 200
+        if route is None:
+            status, response = 404, {"error": f"No endpoint {method} {endpoint}"}
+        else:
+            try:
+                response = getattr(self.service, route)(self._read_body())
+            except (ValueError, KeyError, TypeError) as error:
+                status, response = 400, {"error": str(error)}
+            except Exception as error:
+                status, response = 500, {"error": f"{type(error).__name__}: {error}"}
+
+        payload = json.dumps(response).encode()
+        # record before replying, so a client's next request already sees this one in /metrics
+        if route is not None:
+            self.service.stats.record(endpoint, time.perf_counter() - start, status != 200)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_body(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length == 0:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except json.JSONDecodeError as error:
+            raise ValueError(f"Invalid JSON: {error}") from error
+        if not isinstance(body, dict):
+            raise ValueError("Request body must be a JSON object")
+        return body
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def make_server(service: AnalysisService, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    """HTTP server answering requests concurrently, one thread per request. Port 0 picks a free port."""
+    handler = type("RequestHandler", (_RequestHandler,), {"service": service})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve(host: str = "127.0.0.1", port: int = 8765, corpus_path: str = "test_examples", use_cache: bool = True) -> None:
+    service = AnalysisService(corpus_path, ResultCache() if use_cache else None)
+    server = make_server(service, host, port)
+    print(f"Serving on http://{host}:{server.server_address[1]} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
@@ -0,0 +1,169 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import socket
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.pipeline import PipelineResult
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse "i/N" (0 <= i < N)."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Shard must look like i/N, got '{value}'") from None
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Shard index must be in [0, {count}), got '{value}'")
+    return index, count
+
+
+def select_shard(csv_paths: Iterable[str], index: int, count: int) -> List[str]:
+    """Task sets of shard `index` out of `count`.
+
+    A task set goes to the shard given by a hash of its file name, so the
+    split is the same on every machine and adding a file does not move the
+    others to a different shard.
+    """
+    return sorted(path for path in csv_paths if _stable_hash(os.path.basename(path)) % count == index)
+
+
+def summarize(result: PipelineResult) -> Dict[str, Any]:
+    """The fields main.simulation() prints for one result, as plain JSON values."""
+    metrics = result.metrics
+    summary = {
+        "task_set": metrics.task_set_name,
+        "algorithm": metrics.algorithm,
+        "util": float(metrics.util),
+        "num_late_tasks": int(metrics.num_late_tasks),
+        "is_schedulable_theoretical": bool(metrics.is_schedulable_theoretical),
+        "analysis": result.analysis,
+        "analysis_schedulable": bool(result.analysis_schedulable),
+        "is_scheduable_simulator": bool(metrics.is_scheduable_simulator),
+    }
+    if metrics.mode_switches is not None:
+        summary["mode_switches"] = metrics.mode_switches
+        summary["lo_service_degradation"] = metrics.lo_service_degradation
+    return summary
+
+
+class ShardResultWriter:
+    """Appends one JSON line per result and flushes it, so a crashed shard keeps what it finished."""
+
+    def __init__(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.file = open(path, "a", encoding="utf-8")
+
+    def write(self, summary: Dict[str, Any]) -> None:
+        self.file.write(json.dumps(summary) + "\n")
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def merge_results(results_dir: str) -> List[Dict[str, Any]]:
+    """All results of all shard files, one per task set and algorithm, sorted by task set."""
+    merged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for file_name in sorted(os.listdir(results_dir)):
+        if not file_name.endswith(".jsonl"):
+            continue
+        with open(os.path.join(results_dir, file_name), encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    summary = json.loads(line)
+                    merged[(summary["task_set"], summary["algorithm"])] = summary
+    return [merged[key] for key in sorted(merged)]
+
+
+class WorkQueue:
+    """Work items claimed through lock files in a directory shared by all machines.
+
+    A claim is an exclusively created `<name>.lock` file, which is atomic on
+    local and NFS file systems. A finished item gets a `<name>.done` file.
+    Claims without a done file older than `stale_after` seconds (a crashed
+    worker) are taken over by replacing their lock, which only one of the
+    workers that find it stale can do; each takeover leaves a
+    `<name>.lock.<hash>.takeover` marker behind.
+    """
+
+    def __init__(self, work_dir: str, stale_after: Optional[float] = None) -> None:
+        self.work_dir = work_dir
+        self.stale_after = stale_after
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        os.makedirs(work_dir, exist_ok=True)
+
+    def claim_all(self, csv_paths: Iterable[str]) -> Iterator[str]:
+        """Lazily claim items, so workers pulling concurrently split the corpus between them."""
+        for path in sorted(csv_paths):
+            if self.claim(os.path.basename(path)):
+                yield path
+
+    def claim(self, name: str) -> bool:
+        lock_path = self._path(name, "lock")
+        if os.path.exists(self._path(name, "done")):
+            return False
+        if self._try_create(lock_path):
+            return True
+        if self.stale_after is not None:
+            return self._take_over(lock_path)
+        return False
+
+    def complete(self, name: str) -> None:
+        with open(self._path(name, "done"), "w", encoding="utf-8") as f:
+            f.write(self.worker_id)
+
+    def _try_create(self, lock_path: str) -> bool:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(f"{self.worker_id} {time.time()}")
+        return True
+
+    def _take_over(self, lock_path: str) -> bool:
+        """Replace a stale lock by our own; of the workers that find it stale only one succeeds.
+
+        The lock is never removed, so no worker can claim the item by creating
+        it meanwhile. The right to replace this particular lock (its content and
+        modification time) goes to whoever exclusively creates its takeover
+        marker, and no one else replaces a lock with that content.
+        """
+        lock = self._read(lock_path)
+        if lock is None:
+            return self._try_create(lock_path)
+        owner, modified_ns = lock
+        if time.time() - modified_ns / 1e9 <= self.stale_after:
+            return False
+        marker = hashlib.sha1(f"{owner} {modified_ns}".encode()).hexdigest()[:16]
+        if not self._try_create(f"{lock_path}.{marker}.takeover"):
+            return False
+        if self._read(lock_path) != lock:
+            return False
+
+        new_lock_path = f"{lock_path}.{marker}.new"
+        with open(new_lock_path, "w", encoding="utf-8") as f:
+            f.write(f"{self.worker_id} {time.time()}")
+        os.replace(new_lock_path, lock_path)
+        return True
+
+    @staticmethod
+    def _read(lock_path: str) -> Optional[Tuple[str, int]]:
+        """Content and modification time of a lock, both of the same file."""
+        try:
+            with open(lock_path, encoding="utf-8") as f:
+                return f.read(), os.fstat(f.fileno()).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _path(self, name: str, kind: str) -> str:
+        return os.path.join(self.work_dir, f"{name}.{kind}")
+
+
+def _stable_hash(value: str) -> int:
+    return int.from_bytes(hashlib.sha1(value.encode()).digest()[:8], "big")
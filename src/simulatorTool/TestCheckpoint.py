@@ -0,0 +1,88 @@
+import os
+import pickle
+import tempfile
+import unittest
+import zlib
+import pandas as pd
+from src.simulatorTool.simulator import JOB_LISTS, JOBS_LOG_SUFFIX, Simulator
+from src.simulatorTool.earliest_deadline_first import EDF
+from src.simulatorTool.rate_monotonic import RateMonotonic
+
+
+class _Interrupted(Exception):
+    pass
+
+
+class _InterruptedSimulator(Simulator):
+    """Stops the run right after writing its second checkpoint."""
+
+    def save_checkpoint(self, checkpoint_path):
+        super().save_checkpoint(checkpoint_path)
+        if self.hyperperiods_done == 2:
+            raise _Interrupted()
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.task_set = pd.DataFrame({
+            'task_id': ['A', 'B', 'C'],
+            'T_i': [4, 5, 10],
+            'D_i': [4, 5, 10],
+            'C_i_min': [0, 1, 1],
+            'C_i': [1, 2, 3],
+            'J_i': [1, 0, 2],
+        })
+        self.checkpoint_path = os.path.join(tempfile.mkdtemp(), "run.ckpt")
+
+    def test_resume_is_identical(self):
+        expected = Simulator().start(self.task_set, EDF(), False, 5, 7)
+
+        with self.assertRaises(_Interrupted):
+            _InterruptedSimulator().start(self.task_set, EDF(), False, 5, 7, checkpoint_path=self.checkpoint_path,
+                                          checkpoint_every=1)
+        results = Simulator().resume(self.checkpoint_path)
+
+        self.assertEqual(results.job_response_times_by_task, expected.job_response_times_by_task)
+        self.assertEqual(results.job_release_times_by_task, expected.job_release_times_by_task)
+        self.assertEqual(results.job_completion_times_by_task, expected.job_completion_times_by_task)
+        self.assertEqual(results.simulated_hyperperiods, 5)
+
+    def test_jobs_log_holds_the_completed_jobs(self):
+        expected = Simulator().start(self.task_set, RateMonotonic(), False, 5, 3)
+
+        with self.assertRaises(_Interrupted):
+            _InterruptedSimulator().start(self.task_set, RateMonotonic(), False, 5, 3, checkpoint_path=self.checkpoint_path,
+                                          checkpoint_every=1)
+        with open(self.checkpoint_path, "rb") as f:
+            state = pickle.loads(zlib.decompress(f.read()))
+        self.assertFalse(set(JOB_LISTS) & set(state))
+        self.assertEqual(sum(state["logged_jobs"].values()), state["num_completed_jobs"])
+
+        # a segment appended by a run that died before writing its checkpoint is ignored
+        with open(self.checkpoint_path + JOBS_LOG_SUFFIX, "ab") as f:
+            f.write(b"partial segment")
+        results = Simulator().resume(self.checkpoint_path)
+
+        self.assertEqual(results.job_response_times_by_task, expected.job_response_times_by_task)
+        self.assertEqual(results.job_activation_times_by_task, expected.job_activation_times_by_task)
+        self.assertEqual(results.average_response_time, expected.average_response_time)
+
+        Simulator.remove_checkpoint(self.checkpoint_path)
+        self.assertEqual(os.listdir(os.path.dirname(self.checkpoint_path)), [])
+
+    def test_steady_state_matches_full_simulation(self):
+        task_set = self.task_set.drop(columns=['J_i']).assign(O_i=[0, 3, 1])
+
+        expected = Simulator().start(task_set, RateMonotonic(), True, 50, steady_state=False)
+        results = Simulator().start(task_set, RateMonotonic(), True, 50)
+
+        self.assertLessEqual(results.simulated_hyperperiods, 2)
+        self.assertEqual(results.job_response_times_by_task, expected.job_response_times_by_task)
+        self.assertEqual(results.job_activation_times_by_task, expected.job_activation_times_by_task)
+        self.assertEqual(results.job_completion_times_by_task, expected.job_completion_times_by_task)
+        self.assertEqual(results.num_late_tasks, expected.num_late_tasks)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+from src.simulatorTool.task_set import TaskSet
+from src.simulatorTool.simulator import Simulator
+from src.simulatorTool.rate_monotonic import RateMonotonic
+
+
+class TestMixedCriticality(unittest.TestCase):
+
+    def setUp(self):
+        # task 1: HI, budget 1 in LO mode, runs 3 (WCET_HI); task 2: LO
+        self.task_set = TaskSet.from_arrays(C=[1, 2], T=[5, 10], C_hi=[3, 2], hi_criticality=[True, False])
+
+    def test_mode_switch_drops_lo_jobs(self):
+        results = Simulator().start(self.task_set, RateMonotonic(), True, 2, mixed_criticality=True)
+
+        # t=0: task 1 overruns at t=1, the job of task 2 is dropped, idle at t=3 -> LO mode; same from t=5, 10 and 15
+        self.assertEqual(results.mode_switches, 4)
+        self.assertEqual(results.hi_mode_time, 8)
+        self.assertEqual(results.dropped_jobs_by_task, {2: 2})
+        self.assertEqual(results.lo_service_degradation, 1.0)
+        self.assertEqual(results.job_response_times_by_task, {1: [('1_0', 3), ('1_5', 3), ('1_10', 3), ('1_15', 3)]})
+        self.assertTrue(results.is_scheduable_simulator)
+
+    def test_lo_mode_without_overrun(self):
+        results = Simulator().start(self.task_set, RateMonotonic(), True, 2)
+        self.assertIsNone(results.mode_switches)
+        self.assertEqual(results.job_response_times_by_task[2], [('2_0', 3), ('2_10', 3)])
+
+        # C_i_HI = C_i for task 1, so its jobs never exceed their LO budget
+        no_overrun = TaskSet.from_arrays(C=[1, 2], T=[5, 10], C_min=[1, 2], C_hi=[1, 2], hi_criticality=[True, False])
+        results = Simulator().start(no_overrun, RateMonotonic(), False, 2, mixed_criticality=True)
+        self.assertEqual(results.mode_switches, 0)
+        self.assertEqual(results.lo_service_degradation, 0.0)
+        self.assertEqual(results.job_response_times_by_task[2], [('2_0', 3), ('2_10', 3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.simulatorTool.simulator import Simulator
+from src.simulatorTool.rate_monotonic import RateMonotonic
+from src.simulatorTool.release_model import ReleaseStream
+from src.analysisTool.response_time_analysis_RM import response_time_analysis_rta
+
+
+class TestReleaseModel(unittest.TestCase):
+
+    def setUp(self):
+        self.sim = Simulator()
+        self.scheduler = RateMonotonic()
+
+    def test_offset_shifts_activations(self):
+        task_set = pd.DataFrame({
+            'task_id': ['A', 'B'],
+            'T_i': [4, 5],
+            'D_i': [4, 5],
+            'C_i': [1, 3],
+            'O_i': [0, 2],
+        })
+
+        results = self.sim.start(task_set, self.scheduler, True)
+
+        expected_activation = {
+            'A': [('A_0', 0), ('A_4', 4), ('A_8', 8), ('A_12', 12), ('A_16', 16)],
+            'B': [('B_2', 2), ('B_7', 7), ('B_12', 12), ('B_17', 17)]
+        }
+        self.assertEqual(results.job_activation_times_by_task, expected_activation)
+
+    def test_sporadic_respects_minimum_inter_arrival(self):
+        task = pd.Series({'task_id': 'A', 'T_i': 10, 'S_i': 5, 'release': 'sporadic'})
+        stream = ReleaseStream(task, np.random.default_rng(1), 10_000, block_size=8)
+
+        activations = []
+        while (release := stream.next_release()) is not None:
+            activations.append(release[0])
+
+        gaps = np.diff(activations)
+        self.assertTrue(np.all(gaps >= 10))
+        self.assertTrue(np.all(gaps <= 15))
+        self.assertGreater(len(set(gaps.tolist())), 1)
+
+    def test_jitter_stays_within_rta_bound(self):
+        task_sets = [
+            pd.DataFrame({
+                'task_id': ['A', 'B', 'C'],
+                'T_i': [5, 8, 20],
+                'D_i': [5, 8, 20],
+                'C_i': [1, 2, 4],
+                'J_i': [2, 1, 3],
+            }),
+            # equal periods: A keeps its priority over B when its jitter releases it after B
+            pd.DataFrame({
+                'task_id': ['A', 'B', 'C'],
+                'T_i': [8, 8, 20],
+                'D_i': [8, 8, 20],
+                'C_i': [1, 2, 1],
+                'J_i': [1, 0, 3],
+            }),
+        ]
+
+        for task_set in task_sets:
+            _, rta = response_time_analysis_rta(task_set)
+            bounds = dict(zip(rta['task_id'], rta['R_i']))
+
+            for seed in range(5):
+                results = self.sim.start(task_set, self.scheduler, True, 5, seed)
+                for task_id, responses in results.job_response_times_by_task.items():
+                    self.assertLessEqual(max(r for _, r in responses), bounds[task_id], (task_id, seed))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.simulatorTool.task_set import TaskSet, as_task_set
+from src.simulatorTool.simulator import Simulator
+from src.simulatorTool.rate_monotonic import RateMonotonic
+from src.analysisTool.response_time_analysis_RM import response_time_analysis_rta
+from src.analysisTool.demand_analysis_EDF import demand_analysis_edf
+
+
+class TestTaskSet(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'task_id': [1, 2, 3],
+            'C_i_min': [1, 1, 2],
+            'C_i': [1, 2, 3],
+            'T_i': [4, 5, 10],
+            'D_i': [4, 5, 9],
+            'csv_id': ['set.csv'] * 3,
+        })
+
+    def test_dataframe_adapters_share_memory(self):
+        task_set = TaskSet.from_dataframe(self.df)
+        self.assertTrue(np.shares_memory(task_set.C, self.df['C_i'].to_numpy()))
+        self.assertEqual(task_set.name, 'set.csv')
+
+        df = task_set.to_dataframe()
+        self.assertTrue(np.shares_memory(df['T_i'].to_numpy(), task_set.T))
+        pd.testing.assert_frame_equal(df, self.df)
+
+    def test_immutable(self):
+        task_set = TaskSet.from_dataframe(self.df)
+        with self.assertRaises(ValueError):
+            task_set.C[0] = 5
+        with self.assertRaises(AttributeError):
+            task_set.C = np.array([5, 5, 5])
+
+    def test_defaults_and_validation(self):
+        task_set = TaskSet.from_arrays(C=[1, 2], T=[4, 6])
+        self.assertEqual(task_set.D.tolist(), [4, 6])
+        self.assertEqual(task_set.C_min.tolist(), [1, 2])
+        self.assertEqual(task_set.ids.tolist(), [1, 2])
+        self.assertEqual(task_set.C.dtype, np.int64)
+        with self.assertRaises(ValueError):
+            TaskSet.from_dataframe(self.df.drop(columns=['D_i']))
+        with self.assertRaises(ValueError):
+            TaskSet.from_arrays(C=[1.5], T=[4])
+        with self.assertRaises(ValueError):
+            TaskSet.from_arrays(C=[2**64, 1.5], T=[2**65, 4])
+
+        # numpy alone would round this list to float64
+        big = TaskSet.from_arrays(C=[2**64 - 1, 1], T=[2**65, 4])
+        self.assertEqual(big.C.tolist(), [2**64 - 1, 1])
+
+    def test_entry_points_accept_task_set(self):
+        task_set = as_task_set(self.df)
+
+        expected = Simulator().start(self.df, RateMonotonic(), True, 2)
+        results = Simulator().start(task_set, RateMonotonic(), True, 2)
+        self.assertEqual(results.job_response_times_by_task, expected.job_response_times_by_task)
+        self.assertEqual(results.task_set_name, 'set.csv')
+
+        schedulable, rta = response_time_analysis_rta(task_set)
+        expected_schedulable, expected_rta = response_time_analysis_rta(self.df)
+        self.assertEqual(schedulable, expected_schedulable)
+        self.assertEqual(rta['R_i'].tolist(), expected_rta['R_i'].tolist())
+        self.assertEqual(demand_analysis_edf(task_set), demand_analysis_edf(self.df))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,16 @@
+from __future__ import annotations
+from typing import Any, Mapping
+
+LO = "LO"
+HI = "HI"
+
+
+def get_criticality(task_type: Mapping[str, Any]) -> str:
+    """Criticality level of a task row: "LO" (default) or "HI"."""
+    level = task_type.get("criticality", LO)
+    if not isinstance(level, str) or not level.strip():
+        return LO
+    level = level.strip().upper()
+    if level not in (LO, HI):
+        raise ValueError(f"Unknown criticality level '{level}' for task {task_type['task_id']}")
+    return level
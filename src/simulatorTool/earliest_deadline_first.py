@@ -1,6 +1,11 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Union
+
 from src.simulatorTool.scheduler import PeriodicTaskSetScheduler
-import pandas as pd
-from src.simulatorTool.simulator import Simulator
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from src.simulatorTool.task_set import TaskSet
 
 
 class EDF(PeriodicTaskSetScheduler):
@@ -29,7 +34,7 @@ class EDF(PeriodicTaskSetScheduler):
         utilization = sum(tasks['C_i'] / tasks['T_i'])
         return utilization <= 1.0
     
-    def get_least_upper_bound(self, tasks: pd.DataFrame) -> float:
+    def get_least_upper_bound(self, tasks: Union[TaskSet, pd.DataFrame]) -> float:
         return 1.0
     
     def __str__(self):
@@ -1,8 +1,8 @@
-import pandas as pd
-from typing import Optional
+from __future__ import annotations
 import random
-random.seed(42)
-pd.set_option("display.max_colwidth", None)
+from typing import Any, Mapping, Optional
+
+from src.simulatorTool.criticality import HI
 
 class Job:
     """Represents a single job (release) of a periodic task.
@@ -11,21 +11,31 @@ class Job:
     inspect and aggregate stats.
     """
 
-    def __init__(self, tasktype: pd.Series, activation: int, wcet: bool) -> None:
+    def __init__(self, tasktype: Mapping[str, Any], activation: int, wcet: bool, release: Optional[int] = None,
+                 rng: Optional[random.Random] = None, mixed_criticality: bool = False, task_index: int = 0) -> None:
         self.job_id: str = f"{tasktype['task_id']}_{activation}"
         self.task_id: str = tasktype['task_id']
+        self.task_index: int = task_index  # position in the task set, breaks priority ties
 
         
         # Task parameters
         self.T: int = int(tasktype['T_i'])
-        relative_deadline = int(tasktype['D_i'])
-        execution_time = self._calculate_execution_time(tasktype, wcet) 
+        self.D: int = int(tasktype['D_i'])
+        relative_deadline = self.D
+        # mixed criticality: HI jobs may run up to their HI-level WCET, beyond the LO-level budget C_i
+        self.is_hi_criticality: bool = mixed_criticality and tasktype.get('criticality') == HI
+        self.lo_budget: int = int(tasktype['C_i'])
+        if self.is_hi_criticality:
+            tasktype = dict(tasktype, C_i=tasktype['C_i_HI'])
+        execution_time = self._calculate_execution_time(tasktype, wcet, rng or random) 
+        self.execution_time: int = execution_time
 
         
         # Dynamic state
         self.remaining_time_till_done = execution_time
         self.d: int = activation + relative_deadline  # absolute deadline
         self.a: int = activation                      # activation time
+        self.r: int = activation if release is None else release  # release time (activation + jitter)
         self.s: Optional[int] = None                  # start time
         self.f: Optional[int] = None                  # finish time
 
@@ -34,11 +44,11 @@ class Job:
         self.response_time: Optional[int] = None
         self.isExecuting: bool = False
 
-    def _calculate_execution_time(self, tasktype: pd.Series, wcet: bool):
+    def _calculate_execution_time(self, tasktype: Mapping[str, Any], wcet: bool, rng):
         if wcet:
             return tasktype["C_i"]
         elif "C_i_min" in tasktype:
-            return random.randrange(tasktype["C_i_min"], tasktype['C_i']+1)
+            return rng.randrange(tasktype["C_i_min"], tasktype['C_i']+1)
         else:
             raise ValueError("calculation of execution_time not working")
 
@@ -58,6 +68,10 @@ class Job:
         if self.s is None:
             self.s = int(start_time)
 
+    def lo_budget_left(self) -> int:
+        """Execution time left before the job overruns its LO-level budget (negative once it has)."""
+        return self.lo_budget - (self.execution_time - self.remaining_time_till_done)
+
     def is_late(self) -> bool:
         """Return True if the job finished after its deadline."""
         if self.f is None:
@@ -1,21 +1,31 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Union
+
 from src.simulatorTool.scheduler import PeriodicTaskSetScheduler
-import pandas as pd
-from src.simulatorTool.simulator import Simulator
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from src.simulatorTool.task_set import TaskSet
 
 
 class RateMonotonic(PeriodicTaskSetScheduler):
-    """Rate Monotonic priority scheduler: shorter period == higher priority."""
+    """Rate Monotonic priority scheduler: shorter period == higher priority.
+
+    Equal periods are ordered by deadline and then task index, like
+    TaskSet.priority_order() in the RTA, so a task keeps its priority over
+    its twin also when jitter releases its job later.
+    """
 
     def select_next_job_from_active(self, active_jobs: list):
         if not active_jobs:
             return None
-        return min(active_jobs, key=lambda job: job.T)
+        return min(active_jobs, key=lambda job: (job.T, job.D, job.task_index, job.a))
 
-    def is_scheduable(self, tasks: pd.DataFrame) -> bool:
+    def is_scheduable(self, tasks: Union[TaskSet, pd.DataFrame]) -> bool:
         hyperbolic_product = self.get_least_upper_bound(tasks)
         return hyperbolic_product <= 2
     
-    def get_least_upper_bound(self, tasks: pd.DataFrame) -> float:
+    def get_least_upper_bound(self, tasks: Union[TaskSet, pd.DataFrame]) -> float:
         utilizations = tasks['C_i'] / tasks['T_i']
         hyperbolic_product = 1.0
         for u in utilizations:
@@ -0,0 +1,91 @@
+from __future__ import annotations
+import math
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+PERIODIC = "periodic"
+SPORADIC = "sporadic"
+
+
+def get_task_parameter(task_type: Mapping[str, Any], column: str, default: int = 0) -> int:
+    """Read an optional integer column of a task row, `default` if missing or empty."""
+    value = task_type.get(column, default)
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return default
+    return int(value)
+
+
+def get_release_model(task_type: Mapping[str, Any]) -> str:
+    """Release model of a task row: "periodic" (default) or "sporadic"."""
+    model = task_type.get("release", PERIODIC)
+    if not isinstance(model, str) or not model.strip():
+        return PERIODIC
+    model = model.strip().lower()
+    if model not in (PERIODIC, SPORADIC):
+        raise ValueError(f"Unknown release model '{model}' for task {task_type['task_id']}")
+    return model
+
+
+class ReleaseStream:
+    """Lazily generates the (activation, release) times of one task.
+
+    Activations start at the offset O_i and are T_i apart. Sporadic tasks
+    treat T_i as the minimum inter-arrival time and add a random slack in
+    [0, S_i]. Each release is delayed by a random jitter in [0, J_i].
+    Random draws come from the task's own generator in blocks, so a task
+    set with many jobs only pays for one numpy call per block.
+    """
+
+    def __init__(self, task_type: Mapping[str, Any], rng: np.random.Generator, horizon: int, block_size: int = 256) -> None:
+        self.T: int = int(task_type['T_i'])
+        self.offset: int = get_task_parameter(task_type, 'O_i')
+        self.jitter: int = get_task_parameter(task_type, 'J_i')
+        self.slack: int = get_task_parameter(task_type, 'S_i')
+        self.is_sporadic: bool = get_release_model(task_type) == SPORADIC
+
+        self.rng = rng
+        self.horizon = horizon
+        self.block_size = block_size
+
+        self.next_activation: int = self.offset
+        self._jitter_samples = ()
+        self._jitter_idx = 0
+        self._slack_samples = ()
+        self._slack_idx = 0
+
+    def next_release(self) -> Optional[Tuple[int, int]]:
+        """Return the next (activation, release) pair, or `None` past the horizon."""
+        if self.next_activation >= self.horizon:
+            return None
+
+        activation = self.next_activation
+        release = activation + self._draw_jitter()
+
+        inter_arrival = self.T
+        if self.is_sporadic:
+            inter_arrival += self._draw_slack()
+        self.next_activation = activation + inter_arrival
+
+        return activation, release
+
+    def _draw_jitter(self) -> int:
+        if self.jitter == 0:
+            return 0
+        if self._jitter_idx == len(self._jitter_samples):
+            self._jitter_samples = self.rng.integers(0, self.jitter + 1, size=self.block_size)
+            self._jitter_idx = 0
+        value = int(self._jitter_samples[self._jitter_idx])
+        self._jitter_idx += 1
+        return value
+
+    def _draw_slack(self) -> int:
+        if self.slack == 0:
+            return 0
+        if self._slack_idx == len(self._slack_samples):
+            self._slack_samples = self.rng.integers(0, self.slack + 1, size=self.block_size)
+            self._slack_idx = 0
+        value = int(self._slack_samples[self._slack_idx])
+        self._slack_idx += 1
+        return value
@@ -1,10 +1,13 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List, Optional
-
-import pandas as pd
+from typing import TYPE_CHECKING, List, Optional, Union
 
 from src.simulatorTool.job import Job
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from src.simulatorTool.task_set import TaskSet
+
 
 class PeriodicTaskSetScheduler(ABC):
     """Abstract class for periodic task-set schedulers.
@@ -16,18 +19,18 @@ class PeriodicTaskSetScheduler(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def is_scheduable(self, tasks: pd.DataFrame) -> bool:
-        """Return whether the given `tasks` DataFrame is schedulable under this algorithm."""
+    def is_scheduable(self, tasks: Union[TaskSet, pd.DataFrame]) -> bool:
+        """Return whether the given `tasks` (TaskSet or DataFrame) are schedulable under this algorithm."""
         raise NotImplementedError()
 
     @abstractmethod
-    def get_least_upper_bound(self, tasks: pd.DataFrame) -> float:
+    def get_least_upper_bound(self, tasks: Union[TaskSet, pd.DataFrame]) -> float:
         """Return the analytic least upper bound on utilization for `n` tasks."""
         raise NotImplementedError()
 
-    def get_utilization(self, tasks: pd.DataFrame) -> float:
+    def get_utilization(self, tasks: Union[TaskSet, pd.DataFrame]) -> float:
         """Compute total utilization (sum C_i / T_i) for a task set."""
-        return float(sum(tasks['C_i'] / tasks['T_i']))
+        return float((tasks["C_i"] / tasks["T_i"]).sum())
 
 
 
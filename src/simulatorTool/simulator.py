@@ -1,45 +1,222 @@
 from __future__ import annotations
+import heapq
 import math
-from typing import Dict, List, Optional, Any, Tuple
+import os
+import pickle
+import random
+import zlib
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass
-import pandas as pd
 
+from src.simulatorTool.criticality import HI
 from src.simulatorTool.job import Job
+from src.simulatorTool.release_model import ReleaseStream
+from src.simulatorTool.task_set import TaskSet, as_task_set
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from src.telemetry import ProgressSampler
+
+
+# Bump when the checkpointed simulator state changes shape.
+CHECKPOINT_VERSION = 5
+# Completed jobs are not re-written by every checkpoint but appended, as one segment per
+# checkpoint, to a log next to it: <checkpoint>.jobs
+JOBS_LOG_SUFFIX = ".jobs"
+JOB_LISTS = ("job_response_times_by_task", "job_lateness_by_task", "job_activation_times_by_task",
+             "job_release_times_by_task", "job_completion_times_by_task")
 
 
 class Simulator:
  
-    def start(self, task_set: pd.DataFrame, scheduler: Any, wcet: bool, amountOfHyperPeriods) -> TaskSetMetrics:
-        self._initialize(task_set, scheduler, wcet, amountOfHyperPeriods)
+    def start(self, task_set: Union[TaskSet, pd.DataFrame], scheduler: Any, wcet: bool, amountOfHyperPeriods: int = 1, seed: int = 42,
+              checkpoint_path: Optional[str] = None, checkpoint_every: int = 10, steady_state: bool = True,
+              mixed_criticality: bool = False, telemetry: Optional[ProgressSampler] = None) -> TaskSetMetrics:
+        """Simulate `amountOfHyperPeriods` hyperperiods of `task_set` (a TaskSet or a task set DataFrame).
+
+        With `checkpoint_path` the simulator state is written there every
+        `checkpoint_every` hyperperiods and the completed jobs are appended
+        to `<checkpoint_path>.jobs`, see `resume`. With `steady_state`
+        a deterministic run (WCET, no jitter or slack) stops simulating as
+        soon as the state at a hyperperiod boundary repeats an earlier one:
+        from then on the schedule is periodic, so the jobs of the remaining
+        hyperperiods are copied from the repeating ones and only the final
+        drain after the last release is simulated. The metrics are the same
+        as for a full simulation.
+
+        With `mixed_criticality` HI tasks run up to their HI-level WCET C_i_HI.
+        A HI job that exhausts its LO-level budget C_i switches the system to
+        HI mode: active LO jobs are dropped and new LO jobs are not released
+        until the processor is idle again, when it returns to LO mode.
+
+        A `telemetry` sampler is polled from the main loop to report progress,
+        see `src.telemetry`; it is not part of the checkpointed state.
+        """
+        self._initialize(as_task_set(task_set), scheduler, wcet, amountOfHyperPeriods, seed, mixed_criticality)
+        self.telemetry = telemetry
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        # mode switches and dropped jobs are not part of the boundary state, so no extrapolation
+        self.steady_state = steady_state and not mixed_criticality
+        if self.steady_state and self._is_deterministic():
+            self._remember_boundary_state(self._boundary_state())
         self._run()
-        return self._calculate_metrics(task_set)
+        return self._calculate_metrics(self.task_set)
+
+    def resume(self, checkpoint_path: str, telemetry: Optional[ProgressSampler] = None) -> TaskSetMetrics:
+        """Continue a run from a checkpoint written by `start`, bit-identical to an uninterrupted run."""
+        with open(checkpoint_path, "rb") as f:
+            state = pickle.loads(zlib.decompress(f.read()))
+        if state.pop("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Checkpoint {checkpoint_path} was written by an incompatible simulator version")
+        self.__dict__.update(state)
+        self._load_jobs_log(checkpoint_path + JOBS_LOG_SUFFIX)
+        self.telemetry = telemetry
+        self.checkpoint_path = checkpoint_path
+        self._run()
+        return self._calculate_metrics(self.task_set)
+
+    def save_checkpoint(self, checkpoint_path: str) -> None:
+        """Atomically write the live simulator state, RNG states and running aggregates.
+
+        The jobs completed since the last checkpoint are appended to the jobs
+        log first, so the cost of a checkpoint does not grow with the run.
+        The checkpoint records how far the log is valid; a segment appended
+        by a run that died before writing its checkpoint is cut off again.
+        """
+        self._append_jobs_segment(checkpoint_path + JOBS_LOG_SUFFIX)
+        state = {key: value for key, value in self.__dict__.items() if key != "telemetry" and key not in JOB_LISTS}
+        state["version"] = CHECKPOINT_VERSION
+        data = zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        tmp_path = checkpoint_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, checkpoint_path)
+
+    @staticmethod
+    def remove_checkpoint(checkpoint_path: str) -> None:
+        """Delete a checkpoint and its jobs log, if there are any."""
+        for path in (checkpoint_path, checkpoint_path + JOBS_LOG_SUFFIX):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _append_jobs_segment(self, log_path: str) -> None:
+        segment = {}
+        for field in JOB_LISTS:
+            segment[field] = {
+                task_id: jobs[self.logged_jobs.get(task_id, 0):]
+                for task_id, jobs in getattr(self, field).items() if len(jobs) > self.logged_jobs.get(task_id, 0)
+            }
+        # the job lists are most of the data, the fastest level compresses them nearly as well
+        data = zlib.compress(pickle.dumps(segment, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        with open(log_path, "ab") as f:
+            f.truncate(self.jobs_log_size)
+            f.write(len(data).to_bytes(8, "little"))
+            f.write(data)
+        self.jobs_log_size += 8 + len(data)
+        self.logged_jobs = {task_id: len(jobs) for task_id, jobs in self.job_completion_times_by_task.items()}
+
+    def _load_jobs_log(self, log_path: str) -> None:
+        """Rebuild the completed-job lists from the log segments the checkpoint covers."""
+        for field in JOB_LISTS:
+            setattr(self, field, {})
+        with open(log_path, "rb") as f:
+            data = f.read(self.jobs_log_size)
+        if len(data) < self.jobs_log_size:
+            raise ValueError(f"Jobs log {log_path} is shorter than its checkpoint expects")
+
+        offset = 0
+        while offset < len(data):
+            size = int.from_bytes(data[offset:offset + 8], "little")
+            segment = pickle.loads(zlib.decompress(data[offset + 8:offset + 8 + size]))
+            offset += 8 + size
+            for field, jobs_by_task in segment.items():
+                lists = getattr(self, field)
+                for task_id, jobs in jobs_by_task.items():
+                    lists.setdefault(task_id, []).extend(jobs)
     
-    def _initialize(self, task_set: pd.DataFrame, scheduler: Any, wcet: bool, amountOfHyperPeriods: int) -> None:
+    def _initialize(self, task_set: TaskSet, scheduler: Any, wcet: bool, amountOfHyperPeriods: int, seed: int = 42,
+                    mixed_criticality: bool = False) -> None:
         self.wcet = wcet
         self.scheduler = scheduler
-        self.hyperperiod: int = self._get_hyperperiod(task_set) * amountOfHyperPeriods
-
-        self.jobs_by_arrival_time: Dict[int, List[Job]] = self._calculate_jobs_arrival_times(task_set, self.hyperperiod)
-        self.sorted_arrival_times: List[int] = sorted(self.jobs_by_arrival_time.keys())
+        self.task_set = task_set
+        self.execution_rng = random.Random(seed)
+        self.base_hyperperiod: int = self._get_hyperperiod(task_set)
+        self.amountOfHyperPeriods = amountOfHyperPeriods
+        self.hyperperiod: int = self.base_hyperperiod * amountOfHyperPeriods
+
+        self.telemetry: Optional[ProgressSampler] = None
+        self.checkpoint_path: Optional[str] = None
+        self.checkpoint_every: int = 10
+        self.steady_state: bool = True
+        self.next_boundary: int = self.base_hyperperiod
+        self.hyperperiods_done: int = 0
+        # boundary state -> (hyperperiods done, completed jobs per task), and the states in boundary order
+        self.seen_boundary_states: Dict[tuple, Tuple[int, Dict[str, int]]] = {}
+        self.boundary_states: List[tuple] = []
+        self.steady_state_from: Optional[int] = None
+
+        # One release stream and RNG per task; releases are pulled lazily into a heap
+        # of (release_time, task_index, activation) so only one pending release per task is held.
+        self.task_types: List[Dict[str, Any]] = [task_set.task(index) for index in range(len(task_set))]
+        self.task_index_by_id: Dict[str, int] = {task_type['task_id']: idx for idx, task_type in enumerate(self.task_types)}
+        self.release_streams: List[ReleaseStream] = self._create_release_streams(self.task_types, self.hyperperiod, seed)
+        self.release_queue: List[Tuple[int, int, int]] = []
+        for task_index in range(len(self.release_streams)):
+            self._schedule_next_release(task_index)
 
-        self.completed_jobs: List[Job] = []
         self.active_jobs: List[Job] = []
 
+        # Completed jobs are aggregated right away, so no Job objects are kept (or checkpointed).
+        self.job_response_times_by_task: Dict[str, List] = {}
+        self.job_lateness_by_task: Dict[str, List] = {}
+        self.job_activation_times_by_task: Dict[str, List] = {}
+        self.job_release_times_by_task: Dict[str, List] = {}
+        self.job_completion_times_by_task: Dict[str, List] = {}
+        self.num_completed_jobs: int = 0
+        self.sum_response_times: int = 0
+        self.total_late_jobs: int = 0
+        # jobs per task and bytes already in the jobs log of the checkpoint
+        self.logged_jobs: Dict[str, int] = {}
+        self.jobs_log_size: int = 0
+
         self.current_time: int = 0
-        self.arrival_idx: int = 0
         self.job_in_execution: Optional[Job] = None
+
+        self.mixed_criticality = mixed_criticality
+        self.hi_mode: bool = False
+        self.hi_mode_since: int = 0
+        self.hi_mode_time: int = 0
+        self.mode_switches: int = 0
+        self.dropped_jobs_by_task: Dict[str, int] = {
+            task_type['task_id']: 0 for task_type in self.task_types if task_type['criticality'] != HI
+        } if mixed_criticality else {}
         
     def _run(self) -> None:
         i = 0
+        # the sampler is only called every `every` scheduling decisions, otherwise this is one comparison
+        telemetry = self.telemetry
+        next_sample = math.inf
+        if telemetry is not None:
+            telemetry.begin(self)
+            next_sample = telemetry.every
         while self._has_pending_events():
+            if self.current_time >= self.next_boundary:
+                self._on_hyperperiod_boundary()
+
             self._activate_newly_arrived_jobs()
 
             job = self.scheduler.select_next_job_from_active(self.active_jobs)
             if job is None:
+                if self.hi_mode:
+                    self._switch_to_lo_mode()
                 self._advance_to_next_arrival()
                 continue
 
             i = i + 1
+            if i >= next_sample:
+                next_sample += telemetry.every
+                telemetry.sample(self)
 
             if job.s is None:
                 job.set_started(self.current_time)
@@ -54,33 +231,30 @@ class Simulator:
                 job.f = self.current_time
                 job.response_time = job.f - job.a
                 job.lateness = job.f - job.d
-                self.completed_jobs.append(job)
+                self._record_completed_job(job)
                 self.active_jobs.remove(job)
+            elif job.is_hi_criticality and not self.hi_mode and job.lo_budget_left() <= 0:
+                self._switch_to_hi_mode()
 
-            self._update_arrival_index()
-
-    def _calculate_metrics(self, task_set: pd.DataFrame) -> TaskSetMetrics:
-        """Aggregate per-job and per-task statistics for the run."""
-        job_response_times_by_task: Dict[str, List] = {}
-        lateness_by_task: Dict[str, List] = {}
-        activation_times_by_task: Dict[str, List] = {}
-        completion_times_by_task: Dict[str, List] = {}
-
-        sum_response_times = 0
+        if telemetry is not None:
+            telemetry.sample(self, final=True)
 
-        for job in self.completed_jobs:
-            self._add_to_response_times(job, job_response_times_by_task)
-            self._add_to_lateness_by_task(job, lateness_by_task)
-            self._add_to_activation_times_by_task(job, activation_times_by_task)
-            self._add_to_completion_times_by_task(job, completion_times_by_task)
+    def _record_completed_job(self, job: Job) -> None:
+        self._add_to_response_times(job, self.job_response_times_by_task)
+        self._add_to_lateness_by_task(job, self.job_lateness_by_task)
+        self._add_to_activation_times_by_task(job, self.job_activation_times_by_task)
+        self._add_to_release_times_by_task(job, self.job_release_times_by_task)
+        self._add_to_completion_times_by_task(job, self.job_completion_times_by_task)
 
-            sum_response_times += job.response_time if job.response_time is not None else 0
+        self.num_completed_jobs += 1
+        self.sum_response_times += job.response_time if job.response_time is not None else 0
+        if job.is_late():
+            self.total_late_jobs += 1
 
-        total_late_tasks = sum(1 for job in self.completed_jobs if job.is_late())
-        lateness_values = [job.lateness for job in self.completed_jobs if job.lateness is not None]
-        max_lateness = max(lateness_values) if lateness_values else 0
-
-        average_response_time = (sum_response_times / len(self.completed_jobs)) if self.completed_jobs else 0
+    def _calculate_metrics(self, task_set: TaskSet) -> TaskSetMetrics:
+        """Aggregate per-job and per-task statistics for the run."""
+        total_late_tasks = self.total_late_jobs
+        average_response_time = (self.sum_response_times / self.num_completed_jobs) if self.num_completed_jobs else 0
 
       
         is_scheduable = self.scheduler.is_scheduable(task_set)
@@ -88,7 +262,7 @@ class Simulator:
         util = self.scheduler.get_utilization(task_set)
 
         return TaskSetMetrics(
-            task_set_name = task_set["csv_id"][0],
+            task_set_name = task_set.name,
             algorithm=str(self.scheduler),
             task_set=task_set,
             average_response_time=round(average_response_time, 2),
@@ -97,10 +271,16 @@ class Simulator:
             num_late_tasks=total_late_tasks,
             lub=lub,
             util=util,
-            job_lateness_by_task=lateness_by_task,
-            job_response_times_by_task=job_response_times_by_task,
-            job_activation_times_by_task=activation_times_by_task,
-            job_completion_times_by_task=completion_times_by_task,
+            simulated_hyperperiods=self.steady_state_from if self.steady_state_from is not None else self.amountOfHyperPeriods,
+            job_lateness_by_task=self.job_lateness_by_task,
+            job_response_times_by_task=self.job_response_times_by_task,
+            job_activation_times_by_task=self.job_activation_times_by_task,
+            job_release_times_by_task=self.job_release_times_by_task,
+            job_completion_times_by_task=self.job_completion_times_by_task,
+            mode_switches=self.mode_switches if self.mixed_criticality else None,
+            hi_mode_time=self.hi_mode_time + (self.current_time - self.hi_mode_since if self.hi_mode else 0)
+            if self.mixed_criticality else None,
+            dropped_jobs_by_task=self.dropped_jobs_by_task if self.mixed_criticality else None,
         )
 
 
@@ -129,62 +309,192 @@ class Simulator:
             self.job_in_execution = None
 
     def _has_pending_events(self) -> bool:
-        return self.arrival_idx < len(self.sorted_arrival_times) or bool(self.active_jobs)
+        return bool(self.release_queue) or bool(self.active_jobs)
     
-    def _calculate_time_until_next_event(self) -> int:
-        """Time until the next arrival or the end of the hyperperiod."""
+    def _calculate_time_until_next_event(self) -> Optional[int]:
+        """Time until the next release, `None` if no releases are left."""
         if self._is_more_arrivals():
-            return self.sorted_arrival_times[self.arrival_idx] - self.current_time
+            return self.release_queue[0][0] - self.current_time
         return None
     
     def _determine_execution_time(self, job: Job) -> int:
         """Execution slice length before the next scheduling decision."""
         time_until_next_event = self._calculate_time_until_next_event()
+        if self.next_boundary <= self.hyperperiod:
+            # stop at hyperperiod boundaries; the same job is selected again right after
+            time_until_boundary = self.next_boundary - self.current_time
+            if time_until_next_event is None or time_until_boundary < time_until_next_event:
+                time_until_next_event = time_until_boundary
+
+        if time_until_next_event is None:
+            execution_time = job.remaining_time_till_done
+        else:
+            execution_time = min(job.remaining_time_till_done, time_until_next_event)
 
-        if time_until_next_event == None:
-            return job.remaining_time_till_done
-        
-        if time_until_next_event == 0:
-            return min(1, job.remaining_time_till_done)
-
-        return min(job.remaining_time_till_done, time_until_next_event)
-    
-
+        if job.is_hi_criticality and not self.hi_mode:
+            # stop where the job exhausts its LO-level budget, the mode switches there
+            budget_left = job.lo_budget_left()
+            if 0 < budget_left < execution_time:
+                execution_time = budget_left
+        return execution_time
 
     def _advance_to_next_arrival(self) -> None:
-        """Advance simulation time to the next arrival time or hyperperiod end."""
+        """Advance simulation time to the next release time, hyperperiod boundary or hyperperiod end."""
         if self._is_more_arrivals():
-            self.current_time = self.sorted_arrival_times[self.arrival_idx]
-            self.arrival_idx += 1
+            self.current_time = min(self.release_queue[0][0], self.next_boundary)
             return
         
         self.current_time = self.hyperperiod
 
-    def _update_arrival_index(self) -> None:
-        """Advance the arrival index if we've reached or passed the next arrival."""
-        if self._is_more_arrivals() and self.current_time >= self.sorted_arrival_times[self.arrival_idx]:
-            self.arrival_idx += 1
+    def _switch_to_hi_mode(self) -> None:
+        """A HI job overran its LO-level budget: drop the active LO jobs."""
+        self.hi_mode = True
+        self.hi_mode_since = self.current_time
+        self.mode_switches += 1
+        for job in self.active_jobs:
+            if not job.is_hi_criticality:
+                self.dropped_jobs_by_task[job.task_id] += 1
+                if job is self.job_in_execution:
+                    self._remove_executing_job()
+        self.active_jobs = [job for job in self.active_jobs if job.is_hi_criticality]
+
+    def _switch_to_lo_mode(self) -> None:
+        """Idle instant in HI mode: LO tasks are released again."""
+        self.hi_mode = False
+        self.hi_mode_time += self.current_time - self.hi_mode_since
+
+    def _on_hyperperiod_boundary(self) -> None:
+        """Checkpoint and look for a steady state at a hyperperiod boundary."""
+        self.hyperperiods_done += 1
+        self.next_boundary += self.base_hyperperiod
+        if self.next_boundary > self.hyperperiod:
+            self.next_boundary = math.inf
+
+        if self.checkpoint_path and self.hyperperiods_done % self.checkpoint_every == 0:
+            self.save_checkpoint(self.checkpoint_path)
+
+        if self.steady_state and self._is_deterministic() and self.current_time < self.hyperperiod:
+            state = self._boundary_state()
+            if state in self.seen_boundary_states:
+                self._extrapolate_steady_state(state)
+            else:
+                self._remember_boundary_state(state)
+
+    def _boundary_state(self) -> tuple:
+        """Backlog and pending releases relative to `current_time`; equal states have equal futures."""
+        t = self.current_time
+        active = tuple(
+            (self.task_index_by_id[job.task_id], job.a - t, job.r - t, job.remaining_time_till_done, job.isExecuting)
+            for job in self.active_jobs
+        )
+        releases = tuple(sorted((release - t, task_index, activation - t) for release, task_index, activation in self.release_queue))
+        return active, releases
+
+    def _remember_boundary_state(self, state: tuple) -> None:
+        completed = {task_id: len(jobs) for task_id, jobs in self.job_completion_times_by_task.items()}
+        self.seen_boundary_states[state] = (self.hyperperiods_done, completed)
+        self.boundary_states.append(state)
+
+    def _extrapolate_steady_state(self, state: tuple) -> None:
+        """Copy the repeating hyperperiods up to the horizon, then set up the final drain.
+
+        The state at this boundary equals the one `cycle` time units earlier, so
+        every job that completed in between completes again `cycle`, 2 `cycle`, ...
+        later, as long as that is no later than the horizon (the last release
+        only matters after it). The backlog left at the horizon is the one of
+        the matching boundary in the cycle, and is simulated without releases.
+        """
+        first, completed_at_first = self.seen_boundary_states[state]
+        cycle_hyperperiods = self.hyperperiods_done - first
+        cycle = cycle_hyperperiods * self.base_hyperperiod
+        horizon = self.hyperperiod
+
+        for task_id, completions in list(self.job_completion_times_by_task.items()):
+            lo, hi = completed_at_first.get(task_id, 0), len(completions)
+            activations = self.job_activation_times_by_task[task_id]
+            releases = self.job_release_times_by_task[task_id]
+            shift = cycle
+            while lo < hi and completions[lo][1] + shift <= horizon:
+                for idx in range(lo, hi):
+                    finish = completions[idx][1] + shift
+                    if finish > horizon:
+                        break
+                    activation = activations[idx][1] + shift
+                    self._record_extrapolated_job(task_id, activation, releases[idx][1] + shift, finish)
+                shift += cycle
+
+        # backlog at the horizon: the boundary state at the same position in the cycle, without releases
+        horizon_state = self.boundary_states[first + (self.amountOfHyperPeriods - first) % cycle_hyperperiods]
+        self.steady_state_from = self.hyperperiods_done
+        self.current_time = horizon
+        self.hyperperiods_done = self.amountOfHyperPeriods
+        self.next_boundary = math.inf
+        self.release_queue = []
+        self.active_jobs = []
+        self.job_in_execution = None
+        for task_index, activation, release, remaining, is_executing in horizon_state[0]:
+            job = Job(self.task_types[task_index], horizon + activation, self.wcet, horizon + release, self.execution_rng,
+                      task_index=task_index)
+            job.remaining_time_till_done = remaining
+            if is_executing:
+                job.isExecuting = True
+                self.job_in_execution = job
+            self.active_jobs.append(job)
+
+    def _record_extrapolated_job(self, task_id: str, activation: int, release: int, finish: int) -> None:
+        task_type = self.task_types[self.task_index_by_id[task_id]]
+        job_id = f"{task_id}_{activation}"
+        response_time = finish - activation
+        lateness = finish - (activation + int(task_type['D_i']))
+
+        self.job_response_times_by_task[task_id].append((job_id, response_time))
+        self.job_lateness_by_task[task_id].append((job_id, lateness))
+        self.job_activation_times_by_task[task_id].append((job_id, activation))
+        self.job_release_times_by_task[task_id].append((job_id, release))
+        self.job_completion_times_by_task[task_id].append((job_id, finish))
+
+        self.num_completed_jobs += 1
+        self.sum_response_times += response_time
+        if lateness > 0:
+            self.total_late_jobs += 1
+
+    def _is_deterministic(self) -> bool:
+        """No random execution times, jitter or sporadic slack."""
+        return self.wcet and all(stream.jitter == 0 and stream.slack == 0 for stream in self.release_streams)
+
     def _activate_newly_arrived_jobs(self) -> None:
-        """Move jobs that arrive at `current_time` to the active list."""
-        if self.current_time in self.jobs_by_arrival_time:
-            self.active_jobs.extend(self.jobs_by_arrival_time[self.current_time])
-            del self.jobs_by_arrival_time[self.current_time]
-            
-            
-    def _calculate_jobs_arrival_times(self, task_set: pd.DataFrame, hyperperiod: int) -> Dict[int, List[Job]]:
-        """Instantiate Job objects for each release within the hyperperiod."""
-        jobs_arrival_times: Dict[int, List[Job]] = {}
-        for _, task_type in task_set.iterrows():
-            num_jobs = self._get_num_jobs_for_task(task_type, hyperperiod)
-            for i in range(num_jobs):
-                arrival_time = int(i * task_type['T_i'])
-                job = Job(task_type, arrival_time, self.wcet)
-                jobs_arrival_times.setdefault(arrival_time, []).append(job)
-
-        return jobs_arrival_times
+        """Move jobs released at or before `current_time` to the active list."""
+        while self.release_queue and self.release_queue[0][0] <= self.current_time:
+            release_time, task_index, activation = heapq.heappop(self.release_queue)
+            task_type = self.task_types[task_index]
+            if self.hi_mode and task_type['criticality'] != HI:
+                self.dropped_jobs_by_task[task_type['task_id']] += 1
+            else:
+                job = Job(task_type, activation, self.wcet, release_time, self.execution_rng, self.mixed_criticality, task_index)
+                self.active_jobs.append(job)
+            self._schedule_next_release(task_index)
+
+    def _schedule_next_release(self, task_index: int) -> None:
+        """Pull the next release of a task from its stream into the event queue."""
+        next_release = self.release_streams[task_index].next_release()
+        if next_release is not None:
+            activation, release_time = next_release
+            heapq.heappush(self.release_queue, (release_time, task_index, activation))
+
+    def _create_release_streams(self, task_types: List[Dict[str, Any]], horizon: int, seed: int) -> List[ReleaseStream]:
+        """One independent, reproducible RNG stream per task."""
+        import numpy as np
+
+        child_seeds = np.random.SeedSequence(seed).spawn(len(task_types))
+        return [
+            ReleaseStream(task_type, np.random.default_rng(child_seed), horizon)
+            for task_type, child_seed in zip(task_types, child_seeds)
+        ]
     
     def _add_to_activation_times_by_task(self, job: Job, activation_times_by_task: Dict[str, List]) -> None:
         activation_times_by_task.setdefault(job.task_id, []).append((job.job_id, job.a))
+    def _add_to_release_times_by_task(self, job: Job, release_times_by_task: Dict[str, List]) -> None:
+        release_times_by_task.setdefault(job.task_id, []).append((job.job_id, job.r))
     def _add_to_completion_times_by_task(self, job: Job, completion_times_by_task: Dict[str, List]) -> None:
         completion_times_by_task.setdefault(job.task_id, []).append((job.job_id, job.f))
     def _add_to_response_times(self, job: Job, job_response_times_by_task: Dict[str, List]) -> None:
@@ -192,15 +502,13 @@ class Simulator:
     def _add_to_lateness_by_task(self, job: Job, job_lateness_by_task: Dict[str, List]) -> None:
         job_lateness_by_task.setdefault(job.task_id, []).append((job.job_id, job.lateness))
 
-    def _get_hyperperiod(self, task_set: pd.DataFrame) -> int:
+    def _get_hyperperiod(self, task_set: TaskSet) -> int:
         """Compute the hyperperiod (LCM of task periods)."""
-        periods = [int(p) for p in task_set['T_i'].tolist()]
+        periods = task_set.T.tolist()
         hyperperiod = math.lcm(*periods)
         return int(hyperperiod)
-    def _get_num_jobs_for_task(self, task_type: pd.Series, hyperperiod: int) -> int:
-        return hyperperiod // task_type['T_i']
     def _is_more_arrivals(self) -> bool:
-        return self.arrival_idx < len(self.sorted_arrival_times)
+        return bool(self.release_queue)
 
 
 @dataclass(frozen=True)
@@ -210,15 +518,31 @@ class TaskSetMetrics:
     task_set_name:str
     algorithm:str 
     is_scheduable_simulator: bool
-    task_set: pd.DataFrame
+    task_set: TaskSet
     average_response_time: float
     is_schedulable_theoretical: bool
     lub: float
     util: float
     num_late_tasks: int
+    simulated_hyperperiods: int
 
     # ----- per task -----
     job_lateness_by_task: Dict[str, List[Tuple[str, float]]]
     job_response_times_by_task: Dict[str, List[Tuple[str, float]]]
     job_activation_times_by_task: Dict[str, List[Tuple[str, float]]]
-    job_completion_times_by_task: Dict[str, List[Tuple[str, float]]]
\ No newline at end of file
+    job_release_times_by_task: Dict[str, List[Tuple[str, float]]]
+    job_completion_times_by_task: Dict[str, List[Tuple[str, float]]]
+
+    # ----- mixed criticality mode (None unless simulated with mixed_criticality) -----
+    mode_switches: Optional[int] = None
+    hi_mode_time: Optional[int] = None
+    dropped_jobs_by_task: Optional[Dict[str, int]] = None
+
+    @property
+    def lo_service_degradation(self) -> Optional[float]:
+        """Share of the LO jobs that were dropped in HI mode instead of completed."""
+        if self.dropped_jobs_by_task is None:
+            return None
+        dropped = sum(self.dropped_jobs_by_task.values())
+        completed = sum(len(self.job_completion_times_by_task.get(task_id, [])) for task_id in self.dropped_jobs_by_task)
+        return dropped / (dropped + completed) if dropped + completed else 0.0
\ No newline at end of file
@@ -0,0 +1,268 @@
+from __future__ import annotations
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple, Union
+
+from src.simulatorTool.criticality import HI, LO, get_criticality
+from src.simulatorTool.release_model import PERIODIC, SPORADIC, get_release_model
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# DataFrame column -> TaskSet array
+COLUMNS = {
+    "task_id": "ids",
+    "C_i_min": "C_min",
+    "C_i": "C",
+    "T_i": "T",
+    "D_i": "D",
+    "O_i": "O",
+    "J_i": "J",
+    "S_i": "S",
+    "C_i_HI": "C_hi",
+}
+REQUIRED_COLUMNS = ("C_i", "T_i", "D_i")
+TIME_FIELDS = ("C_min", "C", "T", "D", "O", "J", "S", "C_hi")
+FIELDS = ("ids", *TIME_FIELDS, "sporadic", "hi_criticality")
+INT64_MAX = 2**63 - 1
+
+
+@dataclass(frozen=True, eq=False)
+class TaskSet:
+    """Immutable task set on read-only NumPy int64 arrays, one entry per task.
+
+    The simulator and the analyses work on these arrays directly, DataFrames
+    are only needed to read CSVs and to report. `task_set["C_i"]` returns the
+    C array, so code written against the DataFrame columns also runs on a
+    TaskSet. Offsets O, jitter J and sporadic slack S are 0 when not given.
+    For mixed criticality, C is the LO-level WCET of every task and C_hi the
+    HI-level WCET of the HI tasks (equal to C for LO tasks).
+    Parameters beyond the int64 range are kept exactly as object arrays of
+    Python ints.
+    """
+
+    ids: np.ndarray
+    C_min: np.ndarray
+    C: np.ndarray
+    T: np.ndarray
+    D: np.ndarray
+    O: np.ndarray
+    J: np.ndarray
+    S: np.ndarray
+    C_hi: np.ndarray
+    sporadic: np.ndarray
+    hi_criticality: np.ndarray
+    name: str = ""
+
+    @classmethod
+    def from_arrays(cls, C: Any, T: Any, D: Any = None, C_min: Any = None, ids: Any = None, O: Any = None,
+                    J: Any = None, S: Any = None, sporadic: Any = None, C_hi: Any = None, hi_criticality: Any = None,
+                    name: str = "") -> TaskSet:
+        """Implicit deadlines, C_min = C, LO criticality and task ids 1..n unless given."""
+        import numpy as np
+
+        C = _integers(C)
+        n = len(C)
+        zeros = np.zeros(n, dtype=np.int64)
+        hi = np.zeros(n, dtype=bool) if hi_criticality is None else np.asarray(hi_criticality, dtype=bool)
+        C_hi = C if C_hi is None else np.where(hi, _integers(C_hi), C)
+        if np.any(C_hi < C):
+            raise ValueError("HI-level WCET must not be smaller than the LO-level WCET")
+        return cls(
+            ids=_read_only(np.arange(1, n + 1, dtype=np.int64) if ids is None else np.asarray(ids)),
+            C_min=_integers(C if C_min is None else C_min),
+            C=C,
+            T=_integers(T),
+            D=_integers(T if D is None else D),
+            O=_integers(zeros if O is None else O),
+            J=_integers(zeros if J is None else J),
+            S=_integers(zeros if S is None else S),
+            C_hi=_integers(C_hi),
+            sporadic=_read_only(np.zeros(n, dtype=bool) if sporadic is None else np.asarray(sporadic, dtype=bool)),
+            hi_criticality=_read_only(hi),
+            name=name,
+        )
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> TaskSet:
+        """Integer columns are shared with `df`, not copied. Empty optional cells count as 0, empty C_i_HI as C_i."""
+        missing = set(REQUIRED_COLUMNS) - set(df.columns)
+        if missing:
+            raise ValueError(f"Taskset missing required columns: {sorted(missing)}")
+
+        def column(name: str) -> Optional[np.ndarray]:
+            if name not in df.columns:
+                return None
+            values = df[name]
+            if values.dtype.kind == "f":
+                values = values.fillna(0)
+            return values.to_numpy()
+
+        sporadic = None
+        if "release" in df.columns:
+            sporadic = [get_release_model({"release": model, "task_id": task_id}) == SPORADIC for model, task_id in
+                        zip(df["release"], df["task_id"] if "task_id" in df.columns else range(1, len(df) + 1))]
+        hi_criticality = None
+        if "criticality" in df.columns:
+            hi_criticality = [get_criticality({"criticality": level, "task_id": task_id}) == HI for level, task_id in
+                              zip(df["criticality"], df["task_id"] if "task_id" in df.columns else range(1, len(df) + 1))]
+        C_hi = df["C_i_HI"].fillna(df["C_i"]).to_numpy() if "C_i_HI" in df.columns else None
+
+        return cls.from_arrays(
+            C=column("C_i"), T=column("T_i"), D=column("D_i"), C_min=column("C_i_min"),
+            ids=df["task_id"].to_numpy() if "task_id" in df.columns else None,
+            O=column("O_i"), J=column("J_i"), S=column("S_i"), sporadic=sporadic,
+            C_hi=C_hi, hi_criticality=hi_criticality,
+            name=str(df["csv_id"].iloc[0]) if "csv_id" in df.columns and len(df) else "",
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """DataFrame view with the internal column names; O_i, J_i, S_i, release, C_i_HI and criticality only if used."""
+        import pandas as pd
+
+        columns: Dict[str, Any] = {"task_id": self.ids, "C_i_min": self.C_min, "C_i": self.C, "T_i": self.T, "D_i": self.D}
+        for column in ("O_i", "J_i", "S_i"):
+            values = self[column]
+            if values.any():
+                columns[column] = values
+        if self.sporadic.any():
+            columns["release"] = [SPORADIC if sporadic else PERIODIC for sporadic in self.sporadic]
+        if self.is_mixed_criticality:
+            columns["C_i_HI"] = self.C_hi
+            columns["criticality"] = [HI if hi else LO for hi in self.hi_criticality]
+        df = pd.DataFrame(columns, copy=False)
+        if self.name:
+            df["csv_id"] = self.name
+        return df
+
+    def __len__(self) -> int:
+        return len(self.C)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        if column not in COLUMNS:
+            raise KeyError(column)
+        return getattr(self, COLUMNS[column])
+
+    def __contains__(self, column: str) -> bool:
+        return column in COLUMNS
+
+    def take(self, order: Any) -> TaskSet:
+        """Task set with the tasks in `order` (indices or boolean mask)."""
+        import numpy as np
+
+        order = np.asarray(order)
+        return TaskSet(**{field: _read_only(getattr(self, field)[order]) for field in FIELDS}, name=self.name)
+
+    def priority_order(self) -> np.ndarray:
+        """Deadline monotonic order (D_i, then T_i, stable), the order of the RTA."""
+        import numpy as np
+
+        if self.T.dtype == object or self.D.dtype == object:
+            return np.array(sorted(range(len(self)), key=lambda i: (self.D[i], self.T[i])), dtype=np.intp)
+        return np.lexsort((self.T, self.D))
+
+    def reduce_time_unit(self, fields: Sequence[str] = TIME_FIELDS) -> Tuple[TaskSet, int]:
+        """The task set in units of the GCD of its time parameters in `fields`, and that unit.
+
+        Schedules and response times of the reduced set are those of the
+        original divided by the unit, so analyses can run on smaller numbers
+        (e.g. int64 instead of Python ints) and multiply their results back.
+        Pass only the fields the analysis reads (e.g. a BCET of 1 would block
+        any reduction of an RTA); the other time parameters are rounded down
+        to the unit and must not be used on the reduced set.
+        """
+        import numpy as np
+
+        arrays = [getattr(self, field) for field in fields]
+        if all(array.dtype == np.int64 for array in arrays):
+            unit = int(np.gcd.reduce(np.concatenate(arrays)))
+        else:
+            unit = math.gcd(*(value for array in arrays for value in array.tolist()))
+        if unit <= 1:
+            return self, 1
+
+        reduced = {}
+        for field in TIME_FIELDS:
+            array = getattr(self, field)
+            if array.dtype == np.int64 and unit <= INT64_MAX:
+                reduced[field] = _integers(array // unit)
+            else:
+                reduced[field] = _integers([value // unit for value in array.tolist()])
+        return TaskSet(ids=self.ids, sporadic=self.sporadic, hi_criticality=self.hi_criticality, name=self.name, **reduced), unit
+
+    def task(self, index: int) -> Dict[str, Any]:
+        """One task as a dict of plain Python values, keyed like a DataFrame row."""
+        task_id = self.ids[index]
+        return {
+            "task_id": task_id.item() if hasattr(task_id, "item") else task_id,
+            "C_i_min": int(self.C_min[index]),
+            "C_i": int(self.C[index]),
+            "T_i": int(self.T[index]),
+            "D_i": int(self.D[index]),
+            "O_i": int(self.O[index]),
+            "J_i": int(self.J[index]),
+            "S_i": int(self.S[index]),
+            "release": SPORADIC if self.sporadic[index] else PERIODIC,
+            "C_i_HI": int(self.C_hi[index]),
+            "criticality": HI if self.hi_criticality[index] else LO,
+        }
+
+    @property
+    def utilization(self) -> float:
+        return float((self.C / self.T).sum())
+
+    @property
+    def is_mixed_criticality(self) -> bool:
+        return bool(self.hi_criticality.any())
+
+    def content_key(self) -> bytes:
+        """Bytes identifying the task set, for cache keys."""
+        parts = [self.name.encode(), repr(self.ids.tolist()).encode()]
+        parts += [_array_bytes(getattr(self, field)) for field in FIELDS[1:]]
+        return b"\0".join(parts)
+
+
+def as_task_set(task_set: Union[TaskSet, pd.DataFrame]) -> TaskSet:
+    """Accept a TaskSet or a DataFrame with the internal column names."""
+    if isinstance(task_set, TaskSet):
+        return task_set
+    return TaskSet.from_dataframe(task_set)
+
+
+def _integers(values: Any) -> np.ndarray:
+    """int64 array if every value fits (checked), else an object array of Python ints."""
+    import numpy as np
+
+    array = np.asarray(values)
+    if array.dtype.kind == "f" and not isinstance(values, np.ndarray) and any(isinstance(value, int) for value in values):
+        # numpy promotes a list mixing ints beyond int64 with smaller ones to float64, keep the Python ints
+        array = np.asarray(values, dtype=object)
+    if array.dtype == np.int64:
+        return _read_only(array)
+    if array.dtype.kind == "f" and not np.array_equal(array, np.floor(array)):
+        raise ValueError("Task parameters must be integers")
+    if array.dtype.kind in "iub" and array.dtype.itemsize < 8 or array.dtype.kind == "i":
+        return _read_only(array.astype(np.int64))
+
+    if array.dtype == object and any(value != int(value) for value in array.tolist()):
+        raise ValueError("Task parameters must be integers")
+    python_ints = [int(value) for value in array.tolist()]
+    if all(-INT64_MAX - 1 <= value <= INT64_MAX for value in python_ints):
+        return _read_only(np.array(python_ints, dtype=np.int64))
+    big = np.empty(len(python_ints), dtype=object)
+    big[:] = python_ints
+    return _read_only(big)
+
+
+def _array_bytes(array: np.ndarray) -> bytes:
+    if array.dtype == object:
+        return repr(array.tolist()).encode()
+    return array.tobytes()
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
@@ -0,0 +1,219 @@
+from __future__ import annotations
+import dataclasses
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.simulatorTool.simulator import Simulator
+
+
+@dataclass(frozen=True)
+class ProgressSample:
+    task_set: str
+    algorithm: str
+    pid: int
+    simulated_time: int
+    horizon: int
+    progress: float  # simulated_time / horizon, capped at 1; 1 for the final sample
+    completed_jobs: int
+    jobs_per_second: float
+    elapsed_seconds: float
+    eta_seconds: Optional[float]
+    rss_bytes: Optional[int]
+    peak_rss_bytes: Optional[int]
+    traced_bytes: Optional[int]  # tracemalloc, only if it is tracing (PYTHONTRACEMALLOC=1)
+    traced_peak_bytes: Optional[int]
+    final: bool
+    timestamp: float  # time.time() in the worker, samples can reach the monitor late
+
+
+def memory_usage() -> Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]:
+    """(RSS, peak RSS, tracemalloc current, tracemalloc peak) in bytes, None where unavailable."""
+    rss = peak_rss = traced = traced_peak = None
+    try:
+        import resource
+        # ru_maxrss is in KiB on Linux, in bytes on macOS
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    if rss is not None and peak_rss is not None:
+        # ru_maxrss is updated lazily by the kernel and can trail the current RSS
+        peak_rss = max(peak_rss, rss)
+    if tracemalloc.is_tracing():
+        traced, traced_peak = tracemalloc.get_traced_memory()
+    return rss, peak_rss, traced, traced_peak
+
+
+class ProgressSampler:
+    """Samples the progress of one simulation from inside `Simulator._run`.
+
+    The simulator calls `sample` every `every` scheduling decisions, which
+    only builds a ProgressSample and passes it to `sink` once `interval`
+    seconds have passed since the last one. The hot loop itself only pays
+    for an integer comparison per decision.
+    """
+
+    def __init__(self, sink: Callable[[ProgressSample], Any], interval: float = 1.0, every: int = 4096) -> None:
+        self.sink = sink
+        self.interval = interval
+        self.every = every
+        self.started = 0.0
+        self.last_sample = 0.0
+        self.start_time = 0
+        self.start_jobs = 0
+
+    def begin(self, sim: Simulator) -> None:
+        """Called when `sim` starts or resumes running; rates are measured from here."""
+        self.started = self.last_sample = time.perf_counter()
+        self.start_time = sim.current_time
+        self.start_jobs = sim.num_completed_jobs
+
+    def sample(self, sim: Simulator, final: bool = False) -> None:
+        now = time.perf_counter()
+        if not final and now - self.last_sample < self.interval:
+            return
+        self.last_sample = now
+
+        elapsed = now - self.started
+        horizon = sim.hyperperiod
+        simulated = sim.current_time - self.start_time
+        eta = None
+        if final:
+            eta = 0.0
+        elif simulated > 0:
+            eta = max(0.0, (horizon - sim.current_time) * elapsed / simulated)
+        jobs = sim.num_completed_jobs - self.start_jobs
+        rss, peak_rss, traced, traced_peak = memory_usage()
+        self.sink(ProgressSample(
+            task_set=sim.task_set.name,
+            algorithm=str(sim.scheduler),
+            pid=os.getpid(),
+            simulated_time=int(sim.current_time),
+            horizon=int(horizon),
+            # the run ends with the last job, which may complete before the horizon
+            progress=1.0 if final or not horizon else min(1.0, sim.current_time / horizon),
+            completed_jobs=sim.num_completed_jobs,
+            jobs_per_second=jobs / elapsed if elapsed > 0 else 0.0,
+            elapsed_seconds=elapsed,
+            eta_seconds=eta,
+            rss_bytes=rss,
+            peak_rss_bytes=peak_rss,
+            traced_bytes=traced,
+            traced_peak_bytes=traced_peak,
+            final=final,
+            timestamp=time.time(),
+        ))
+
+
+class TelemetryMonitor:
+    """Collects the ProgressSamples of all simulation workers in a background thread.
+
+    Every `print_interval` seconds (None: never) it prints one progress line
+    per running simulation that sent a new sample since, and with `path` it
+    appends every sample as a JSON line.
+    Worker processes get the queue through `install_worker_telemetry` as
+    pool initializer and sample every `sample_interval` seconds.
+    """
+
+    def __init__(self, print_interval: Optional[float] = 5.0, path: Optional[str] = None, sample_interval: float = 1.0) -> None:
+        self.print_interval = print_interval
+        self.path = path
+        self.sample_interval = sample_interval
+        self.queue = multiprocessing.Queue()
+        self.updated: Dict[Tuple[str, str, int], ProgressSample] = {}
+        self.samples = 0
+        self.thread: Optional[threading.Thread] = None
+
+    def sampler(self) -> ProgressSampler:
+        """Sampler for a simulation in this process."""
+        return ProgressSampler(self.queue.put, self.sample_interval)
+
+    def start(self) -> None:
+        self.thread = threading.Thread(target=self._collect, name="telemetry", daemon=True)
+        self.thread.start()
+
+    def close(self) -> None:
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+    def __enter__(self) -> TelemetryMonitor:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _collect(self) -> None:
+        file = None
+        if self.path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            file = open(self.path, "a", encoding="utf-8")
+        last_print = time.monotonic()
+        try:
+            while True:
+                try:
+                    sample = self.queue.get(timeout=self.print_interval)
+                except queue.Empty:
+                    sample = False
+                if sample is None:
+                    break
+                if sample:
+                    self.samples += 1
+                    key = (sample.task_set, sample.algorithm, sample.pid)
+                    if sample.final:
+                        self.updated.pop(key, None)
+                    else:
+                        self.updated[key] = sample
+                    if file is not None:
+                        file.write(json.dumps(dataclasses.asdict(sample)) + "\n")
+                        file.flush()
+                if self.print_interval is not None and time.monotonic() - last_print >= self.print_interval:
+                    last_print = time.monotonic()
+                    for updated in self.updated.values():
+                        print(format_sample(updated), flush=True)
+                    self.updated.clear()
+        finally:
+            if file is not None:
+                file.close()
+
+
+def format_sample(sample: ProgressSample) -> str:
+    eta = "?" if sample.eta_seconds is None else f"{sample.eta_seconds:.0f}s"
+    memory = ", ".join(f"{label} {value / 2**20:.1f} MiB" for label, value in
+                       [("RSS", sample.rss_bytes), ("peak", sample.peak_rss_bytes), ("traced", sample.traced_bytes)]
+                       if value is not None)
+    return (f"[progress] {sample.task_set} {sample.algorithm}: {sample.progress:.1%} of {sample.horizon} "
+            f"(t={sample.simulated_time}), {sample.jobs_per_second:,.0f} jobs/s, ETA {eta}, {memory}")
+
+
+# Set in simulation worker processes by the pool initializer.
+_worker_telemetry: Optional[Tuple[Any, float]] = None
+
+
+def install_worker_telemetry(sample_queue: Any, sample_interval: float) -> None:
+    """ProcessPoolExecutor initializer: simulations in this worker report to `sample_queue`."""
+    global _worker_telemetry
+    _worker_telemetry = (sample_queue, sample_interval)
+
+
+def worker_sampler() -> Optional[ProgressSampler]:
+    """Sampler for a simulation in a worker process, None if telemetry is off."""
+    if _worker_telemetry is None:
+        return None
+    sample_queue, sample_interval = _worker_telemetry
+    return ProgressSampler(sample_queue.put, sample_interval)